@@ -7,19 +7,64 @@ Configuration settings for Preston RPA system.
 OCR_CONFIDENCE = 0.6
 # Use Turkish language pack
 OCR_LANGUAGE = "tur"
+# Characters Tesseract is allowed to emit for Preston menu text
+OCR_TESSERACT_WHITELIST = (
+    "ABCÇDEFGĞHIİJKLMNOÖPQRSŞTUÜVWXYZabcçdefgğhıijklmnoöpqrsştuüvwxyz0123456789 |-"
+)
 # Tesseract configuration string optimized for single-line menu text
 OCR_TESSERACT_CONFIG = (
     "--oem 1 --psm 7 "
     "-c preserve_interword_spaces=1 "
-    "-c tessedit_char_whitelist=ABCÇDEFGĞHIİJKLMNOÖPQRSŞTUÜVWXYZabcçdefgğhıijklmnoöpqrsştuüvwxyz0123456789 |-"
+    f"-c tessedit_char_whitelist={OCR_TESSERACT_WHITELIST}"
+)
+# Fast presence-check pass: skips loading the dictionary word lists
+OCR_TESSERACT_FAST_CONFIG = (
+    OCR_TESSERACT_CONFIG + " -c load_system_dawg=0 -c load_freq_dawg=0"
 )
+# Downscale factor for the fast OCR pass (``find_text_on_screen(fast=True)``)
+OCR_FAST_SCALE = 0.5
+# Same settings as OCR_TESSERACT_CONFIG, applied to the in-process tesserocr API
+OCR_TESSERACT_VARIABLES = {
+    "preserve_interword_spaces": "1",
+    "tessedit_char_whitelist": OCR_TESSERACT_WHITELIST,
+}
+# Keep the Tesseract model resident via tesserocr when it is installed.
+# Set to False to force the pytesseract (subprocess per call) backend.
+OCR_USE_TESSEROCR = True
 # Minimum similarity ratio (0-1) for fuzzy text matching in OCR
 OCR_FUZZY_THRESHOLD = 0.65
+# Number of OCR results kept per engine, keyed by screenshot content
+OCR_CACHE_SIZE = 16
+# Seconds a cached OCR result stays valid; bounds how stale a hit can be
+OCR_CACHE_TTL = 2.0
+# Number of text search results kept per engine, keyed by screenshot content
+OCR_RESULT_CACHE_SIZE = 64
+# Screenshots are upscaled before OCR until the detected text is at least
+# this many pixels tall
+OCR_MIN_TEXT_HEIGHT = 20
+# Upscale factor applied to screenshots with small text before binarizing
+OCR_PREPROCESS_SCALE = 2
+# Run a morphological close after the open when cleaning up binarized text.
+# Otsu output of crisp UI text rarely has holes to fill, so it is off.
+OCR_MORPH_CLOSE = False
 
 # Timing Settings
 CLICK_DELAY = 1.0
 FORM_FILL_DELAY = 0.5
 MODAL_WAIT_TIMEOUT = 10
+# Backoff bounds (seconds) between polls of OCREngine.wait_for_text
+WAIT_POLL_INITIAL = 0.05
+WAIT_POLL_MAX = 0.5
+# Factor the poll delay grows by while the waited-on region does not change
+WAIT_POLL_GROWTH = 1.3
+# Mean absolute pixel difference (0-255) for a region to count as changed
+WAIT_CHANGE_THRESHOLD = 1.0
+# Seconds of waiting with Tesseract only before EasyOCR is also tried
+WAIT_EASYOCR_AFTER = 2.0
+# Seconds a Preston focus stays trusted before captures re-check activation
+FOCUS_TTL = 2.0
+# Upper bound (seconds) to wait for Preston to take focus after activate()
+FOCUS_SETTLE_TIMEOUT = 0.3
 
 # Text patterns for OCR
 UI_TEXTS = {
@@ -39,6 +84,20 @@ UI_TEXTS = {
     "kapat_button": "Kapat",
 }
 
+# Default OCR search regions for well-known UI texts, used when a caller does
+# not pass an explicit region. Values are ``(left, top, width, height)``
+# fractions of the primary screen so they hold across resolutions.
+MENU_BAND_REGION = (0.0, 0.0, 1.0, 0.3)
+MODAL_CENTER_REGION = (0.1, 0.1, 0.8, 0.8)
+TEXT_REGIONS = {
+    "finans_izle": MENU_BAND_REGION,
+    "banka_hesap_izleme": MODAL_CENTER_REGION,
+    "tamam_button": MODAL_CENTER_REGION,
+    "yeni_button": MENU_BAND_REGION,
+    "kaydet_button": MODAL_CENTER_REGION,
+    "kapat_button": MODAL_CENTER_REGION,
+}
+
 # Mapping tables
 BANK_CODES = {
     "233442112": "6293986",  # Account to Bank code mapping
@@ -6,7 +6,7 @@ import re
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import BinaryIO, Dict, List
 
 from openpyxl import load_workbook
 
@@ -31,46 +31,54 @@ def _parse_date(value) -> str:
     return ""
 
 
-def process_excel_file(file_path: Path | str) -> List[Dict[str, object]]:
+def process_excel_file(file_path: Path | str | BinaryIO) -> List[Dict[str, object]]:
     """Extract and process transaction data from Excel.
 
     Parameters
     ----------
-    file_path: Path or str
-        Path to the Excel file.
+    file_path: Path, str or binary file-like object
+        Path to the Excel file, or an open file such as a Streamlit upload.
 
     Returns
     -------
     List[Dict[str, object]]
         Structured data for RPA processing grouped by date.
     """
-    file_path = Path(file_path)
-    wb = load_workbook(file_path, data_only=True)
-    ws = wb.active
-
-    account_no = ws["B6"].value
-    if not account_no:
-        raise ValueError("Account number (B6) not found in Excel file")
-
-    groups: Dict[str, Dict[str, object]] = defaultdict(lambda: {"toplam_tutar": 0, "islem_sayisi": 0})
-
-    for row in ws.iter_rows(min_row=23, values_only=True):
-        if len(row) < 5:
-            continue
-        islem_tarihi, _, aciklama, islem_tutar, _ = row[:5]
-        if not aciklama or not POSH_PATTERN.search(str(aciklama)):
-            continue
-        tarih = _parse_date(islem_tarihi)
-        if not tarih:
-            continue
-        try:
-            amount = float(islem_tutar)
-        except (TypeError, ValueError):
-            logger.warning("Invalid amount %s on %s", islem_tutar, tarih)
-            continue
-        data = groups[tarih]
-        data["toplam_tutar"] += amount
-        data["islem_sayisi"] += 1
+    if isinstance(file_path, (str, Path)):
+        file_path = Path(file_path)
+        source = file_path
+    else:
+        source = getattr(file_path, "name", "<upload>")
+    # Read-only mode streams rows instead of building the whole workbook
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+
+        account_no = ws["B6"].value
+        if not account_no:
+            raise ValueError("Account number (B6) not found in Excel file")
+
+        groups: Dict[str, Dict[str, object]] = defaultdict(lambda: {"toplam_tutar": 0, "islem_sayisi": 0})
+
+        for row in ws.iter_rows(min_row=23, values_only=True):
+            if len(row) < 5:
+                continue
+            islem_tarihi, _, aciklama, islem_tutar, _ = row[:5]
+            if not aciklama or not POSH_PATTERN.search(str(aciklama)):
+                continue
+            tarih = _parse_date(islem_tarihi)
+            if not tarih:
+                continue
+            try:
+                amount = float(islem_tutar)
+            except (TypeError, ValueError):
+                logger.warning("Invalid amount %s on %s", islem_tutar, tarih)
+                continue
+            data = groups[tarih]
+            data["toplam_tutar"] += amount
+            data["islem_sayisi"] += 1
+    finally:
+        wb.close()
 
     results = [
         {
@@ -82,5 +90,5 @@ def process_excel_file(file_path: Path | str) -> List[Dict[str, object]]:
         }
         for tarih, info in sorted(groups.items())
     ]
-    logger.info("Processed %d date groups from %s", len(results), file_path)
+    logger.info("Processed %d date groups from %s", len(results), source)
     return results
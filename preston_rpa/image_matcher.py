@@ -2,38 +2,120 @@
 
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import cv2
 import numpy as np
 import pyautogui
-from PIL import ImageGrab
 
+from .image_matcher_numba import HAVE_NUMBA, ncc_argmax, template_constants
 from .logger import get_logger
+from .screen_capture import grab
 
 logger = get_logger(__name__)
 
+# Templates with more pixels than this are matched through OpenCL (when
+# available) and with a coarse-to-fine image pyramid search.
+LARGE_TEMPLATE_AREA = 18 * 18
+# Minimum template side for the half-resolution pyramid pass to stay reliable
+PYRAMID_MIN_SIDE = 16
+# Extra pixels around the coarse peak searched at full resolution
+PYRAMID_MARGIN = 4
+
 
 class ImageMatcher:
+    def __init__(self) -> None:
+        # Decoded grayscale templates keyed by path; templates do not change
+        # during a run, so each PNG is read from disk only once.
+        self._tpl_cache: Dict[str, np.ndarray] = {}
+        # Zero-mean template and its norm for the Numba kernel, keyed by path
+        # like _tpl_cache and computed from the same cached pixels
+        self._tpl_stats: Dict[str, Optional[Tuple]] = {}
+
+    def _template_stats(self, template_path: str, template) -> Optional[Tuple]:
+        """Return cached NCC constants for ``template_path``, if Numba is usable."""
+        if not HAVE_NUMBA:
+            return None
+        if template_path not in self._tpl_stats:
+            self._tpl_stats[template_path] = template_constants(template)
+        return self._tpl_stats[template_path]
+
+    @staticmethod
+    def warm_up() -> None:
+        """Run tiny matches so OpenCV (and Numba) kernels are ready for use."""
+        screen = np.zeros((40, 40), dtype=np.uint8)
+        screen[8:24, 8:24] = 255
+        template = screen[4:28, 4:28].copy()
+        cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+        if HAVE_NUMBA:
+            # Triggers JIT compilation (or loading it from Numba's disk cache)
+            ncc_argmax(screen, *template_constants(template))
+
+    def _template(self, template_path: str) -> Optional[np.ndarray]:
+        """Return the grayscale template for ``template_path``, decoding it once."""
+        template = self._tpl_cache.get(template_path)
+        if template is None:
+            template = cv2.imread(template_path, 0)
+            if template is not None:
+                self._tpl_cache[template_path] = template
+        return template
+
     def _screenshot(self):
         try:
-            img = ImageGrab.grab()
-            return cv2.cvtColor(np.array(img), cv2.COLOR_BGR2GRAY)
+            return cv2.cvtColor(grab(), cv2.COLOR_BGRA2GRAY)
         except Exception as exc:
             logger.error("Screenshot failed: %s", exc)
             return None
 
+    @staticmethod
+    def _match_template(screen, template) -> Tuple[float, Tuple[int, int]]:
+        """Return the best ``TM_CCOEFF_NORMED`` score and its location."""
+        if template.size > LARGE_TEMPLATE_AREA and cv2.ocl.haveOpenCL():
+            # UMat inputs dispatch to OpenCV's OpenCL (DFT based) kernels
+            screen, template = cv2.UMat(screen), cv2.UMat(template)
+        res = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(res)
+        return max_val, max_loc
+
+    def _locate(
+        self, screen, template, confidence: float, stats: Optional[Tuple] = None
+    ) -> Tuple[float, Tuple[int, int]]:
+        """Find ``template`` in ``screen``, coarse-to-fine for large templates.
+
+        Large templates are first matched at half resolution (a quarter of the
+        pixels); the full-resolution match then only runs in a small window
+        around the coarse peak. If that refined score misses ``confidence``
+        the full screen is searched as before. When ``stats`` (see
+        :meth:`_template_stats`) is given the window is scored by the Numba
+        kernel instead of allocating an OpenCV response map.
+        """
+        h, w = template.shape
+        if template.size > LARGE_TEMPLATE_AREA and min(h, w) >= PYRAMID_MIN_SIDE:
+            _, (cx, cy) = self._match_template(cv2.pyrDown(screen), cv2.pyrDown(template))
+            x0 = max(0, cx * 2 - PYRAMID_MARGIN)
+            y0 = max(0, cy * 2 - PYRAMID_MARGIN)
+            pad = 2 * PYRAMID_MARGIN
+            window = screen[y0 : y0 + h + pad, x0 : x0 + w + pad]
+            if window.shape[0] >= h and window.shape[1] >= w:
+                if stats is not None:
+                    max_val, (wx, wy) = ncc_argmax(window, *stats)
+                else:
+                    max_val, (wx, wy) = self._match_template(window, template)
+                if max_val >= confidence:
+                    return max_val, (x0 + wx, y0 + wy)
+        return self._match_template(screen, template)
+
     def find_icon(self, template_path: str, confidence: float = 0.9) -> Optional[Tuple[int, int, int, int]]:
         """Find UI icons using template matching."""
         screen = self._screenshot()
         if screen is None:
             return None
-        template = cv2.imread(template_path, 0)
+        template = self._template(template_path)
         if template is None:
             logger.error("Template not found: %s", template_path)
             return None
-        res = cv2.matchTemplate(screen, template, cv2.TM_CCOEFF_NORMED)
-        min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(res)
+        stats = self._template_stats(template_path, template)
+        max_val, max_loc = self._locate(screen, template, confidence, stats)
         if max_val < confidence:
             return None
         h, w = template.shape
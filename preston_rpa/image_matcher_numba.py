@@ -0,0 +1,94 @@
+"""Numba kernels for normalized cross-correlation template scoring.
+
+The kernel fuses the ``TM_CCOEFF_NORMED`` computation with the arg-max, so
+scoring a search window never allocates a full response map. Numba is an
+optional dependency; check :data:`HAVE_NUMBA` before calling into it.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; callers fall back to OpenCV
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+def template_constants(template: np.ndarray) -> Optional[Tuple[np.ndarray, float]]:
+    """Return the zero-mean template and its L2 norm.
+
+    Returns ``None`` for a flat template, which has no defined correlation.
+    """
+    tpl = template.astype(np.float64)
+    tpl -= tpl.mean()
+    norm = float(np.sqrt((tpl * tpl).sum()))
+    if norm == 0.0:
+        return None
+    return tpl, norm
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _ncc_argmax(screen, tpl_zm, t_norm, s_sum, s_sqsum):
+    sh, sw = screen.shape
+    th, tw = tpl_zm.shape
+    n = th * tw
+    rows = sh - th + 1
+    cols = sw - tw + 1
+    row_best = np.full(rows, -2.0)
+    row_col = np.zeros(rows, np.int64)
+    for y in prange(rows):
+        best = -2.0
+        best_x = 0
+        for x in range(cols):
+            s = s_sum[y + th, x + tw] - s_sum[y, x + tw] - s_sum[y + th, x] + s_sum[y, x]
+            sq = (
+                s_sqsum[y + th, x + tw]
+                - s_sqsum[y, x + tw]
+                - s_sqsum[y + th, x]
+                + s_sqsum[y, x]
+            )
+            var = sq - s * s / n
+            if var <= 1e-6:
+                continue
+            # sum(T' * (I - mean(I))) == sum(T' * I) because sum(T') == 0
+            acc = 0.0
+            for i in range(th):
+                for j in range(tw):
+                    acc += tpl_zm[i, j] * screen[y + i, x + j]
+            val = acc / (t_norm * np.sqrt(var))
+            if val > best:
+                best = val
+                best_x = x
+        row_best[y] = best
+        row_col[y] = best_x
+    y = np.argmax(row_best)
+    return row_best[y], row_col[y], y
+
+
+def ncc_argmax(
+    screen: np.ndarray, tpl_zm: np.ndarray, t_norm: float
+) -> Tuple[float, Tuple[int, int]]:
+    """Return the best ``TM_CCOEFF_NORMED`` score of a template and its location.
+
+    Parameters
+    ----------
+    screen:
+        Grayscale ``uint8`` search image, at least as large as the template.
+    tpl_zm, t_norm:
+        Output of :func:`template_constants`.
+    """
+    s_sum, s_sqsum = cv2.integral2(screen, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+    val, x, y = _ncc_argmax(screen, tpl_zm, t_norm, s_sum, s_sqsum)
+    return float(val), (int(x), int(y))
@@ -1,13 +1,55 @@
 """Logger utility for Preston RPA system."""
 
 import logging
+import os
+from contextlib import contextmanager
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 LOG_FILE = Path(__file__).resolve().parent / "automation.log"
+# Sentinel file locked while the log is being cleared
+LOCK_FILE = LOG_FILE.with_suffix(".lock")
 _log_file_cleared = False
 
 
+@contextmanager
+def _locked(path: Path):
+    """Hold an exclusive inter-process lock on ``path`` for the block."""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        yield
+    finally:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+
+def _clear_log_file() -> None:
+    """Remove the previous run's log, tolerating concurrent starts."""
+    try:
+        with _locked(LOCK_FILE):
+            LOG_FILE.unlink(missing_ok=True)
+    except OSError:
+        # Another process still holds the log open (Windows) or the
+        # directory is read-only; keep appending to the existing file.
+        pass
+
+
 def get_logger(name: str = "preston_rpa") -> logging.Logger:
     """Return a configured logger instance.
 
@@ -18,14 +60,19 @@ def get_logger(name: str = "preston_rpa") -> logging.Logger:
     global _log_file_cleared
     logger = logging.getLogger(name)
 
-    if not _log_file_cleared and LOG_FILE.exists():
-        LOG_FILE.unlink()
+    if not _log_file_cleared:
+        # Set before any handler opens the file so later calls never unlink
+        # a log that is already being written to.
         _log_file_cleared = True
+        _clear_log_file()
 
     if logger.handlers:
         return logger
 
     logger.setLevel(logging.INFO)
+    # Handlers are attached per logger; propagating would repeat each record
+    # through any handlers configured on the root logger.
+    logger.propagate = False
     formatter = logging.Formatter(
         "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
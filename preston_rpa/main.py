@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import io
 import threading
 import time
+from concurrent.futures import Future
 from queue import Queue
 from pathlib import Path
 from typing import List, Dict
@@ -15,18 +15,78 @@ if __package__ in (None, ""):
     import sys
     sys.path.append(str(Path(__file__).resolve().parent.parent))
     from preston_rpa.excel_processor import process_excel_file
+    from preston_rpa.image_matcher import ImageMatcher
+    from preston_rpa.ocr_engine import OCREngine
     from preston_rpa.preston_automation import PrestonRPA, focus_preston_window
     from preston_rpa.logger import get_logger
 else:
     from .excel_processor import process_excel_file
+    from .image_matcher import ImageMatcher
+    from .ocr_engine import OCREngine
     from .preston_automation import PrestonRPA, focus_preston_window
     from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Number of trailing log characters shown in the UI
+LOG_VIEW_CHARS = 50_000
 
-def run_automation(data: List[Dict[str, object]], simulator_path: str, progress_queue: Queue):
-    rpa = PrestonRPA()
+
+def _tail_log(log_path: Path) -> str:
+    """Return the visible log text, reading only bytes added since the last rerun.
+
+    Streamlit reruns the script on every widget interaction, so the read
+    offset and the text already shown are kept in ``st.session_state``.
+    Only complete lines are consumed; a shrinking file (rotation or the
+    startup reset) starts over from the beginning.
+    """
+    state = st.session_state
+    offset = state.setdefault("log_offset", 0)
+    buf = state.setdefault("log_buf", "")
+    if log_path.stat().st_size < offset:
+        offset, buf = 0, ""
+    with open(log_path, "rb") as f:
+        f.seek(offset)
+        new = f.read()
+    end = new.rfind(b"\n") + 1
+    state.log_offset = offset + end
+    state.log_buf = (buf + new[:end].decode("utf-8", "replace"))[-LOG_VIEW_CHARS:]
+    return state.log_buf
+
+
+def _warm_up_engine() -> Future:
+    """Start building a warmed ``OCREngine`` in the background, once per session.
+
+    Model loading happens while the user is still picking a file, so the
+    first OCR search of a run does not pay for it.
+    """
+    state = st.session_state
+    if "ocr_future" not in state:
+        future: Future = Future()
+
+        def work() -> None:
+            try:
+                engine = OCREngine(debug=True)
+                engine.warm_up()
+                ImageMatcher.warm_up()
+            except Exception as exc:
+                logger.warning("Engine warm-up failed: %s", exc)
+                future.set_exception(exc)
+            else:
+                future.set_result(engine)
+
+        threading.Thread(target=work, daemon=True).start()
+        state.ocr_future = future
+    return state.ocr_future
+
+
+def run_automation(
+    data: List[Dict[str, object]],
+    simulator_path: str,
+    progress_queue: Queue,
+    ocr: OCREngine | None = None,
+):
+    rpa = PrestonRPA(ocr=ocr)
     total = len(data)
     try:
         for idx, entry in enumerate(data, start=1):
@@ -45,6 +105,7 @@ def run_automation(data: List[Dict[str, object]], simulator_path: str, progress_
 def main():
     st.set_page_config(page_title="Preston RPA", layout="wide")
     st.title("Preston RPA Automation")
+    ocr_future = _warm_up_engine()
 
     with st.sidebar:
         st.header("Configuration")
@@ -56,15 +117,16 @@ def main():
     progress_placeholder = st.progress(0.0)
 
     if start_button and uploaded_file is not None:
-        with io.BytesIO(uploaded_file.read()) as buffer:
-            excel_path = Path("uploaded.xlsx")
-            excel_path.write_bytes(buffer.getvalue())
-            data = process_excel_file(excel_path)
+        data = process_excel_file(uploaded_file)
+        try:
+            ocr = ocr_future.result()
+        except Exception:
+            ocr = None  # PrestonRPA builds its own engine
         focus_preston_window(simulator_path)
         progress_queue: Queue = Queue()
         thread = threading.Thread(
             target=run_automation,
-            args=(data, simulator_path, progress_queue),
+            args=(data, simulator_path, progress_queue, ocr),
             daemon=True,
         )
         thread.start()
@@ -87,7 +149,7 @@ def main():
     log_path = Path(__file__).with_name("automation.log")
     if log_path.exists():
         try:
-            log_content = log_path.read_text(encoding="utf-8")
+            log_content = _tail_log(log_path)
         except Exception as exc:
             st.error(f"Failed to read log file: {exc}")
             log_content = ""
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import os
+import threading
 import time
 import re
 import unicodedata
 import warnings
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Tuple, Iterable
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Iterable
 from pathlib import Path
-from difflib import SequenceMatcher
+
+# Tesseract's OpenMP threading is a net loss on small UI crops; run it
+# single-threaded; independent searches can still run in parallel threads.
+# Must be set before the Tesseract library is loaded.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
 
 import numpy as np
 import pandas as pd
@@ -17,23 +28,107 @@ import pytesseract
 import pyautogui
 import pygetwindow as gw
 import cv2
-from PIL import Image, ImageDraw
+from PIL import Image
 
 import easyocr
+from rapidfuzz import fuzz, process
+
+try:
+    from tesserocr import OEM, PSM, RIL, PyTessBaseAPI, iterate_level
+except ImportError:  # tesserocr is optional; pytesseract is used instead
+    PyTessBaseAPI = None
 
 warnings.filterwarnings("ignore", message=".*pin_memory.*")
 
 from .config import (
+    FOCUS_SETTLE_TIMEOUT,
+    FOCUS_TTL,
+    MODAL_WAIT_TIMEOUT,
+    OCR_CACHE_SIZE,
+    OCR_CACHE_TTL,
+    OCR_RESULT_CACHE_SIZE,
     OCR_CONFIDENCE,
+    OCR_FAST_SCALE,
     OCR_LANGUAGE,
+    OCR_MIN_TEXT_HEIGHT,
+    OCR_MORPH_CLOSE,
+    OCR_PREPROCESS_SCALE,
     OCR_TESSERACT_CONFIG,
+    OCR_TESSERACT_FAST_CONFIG,
     OCR_FUZZY_THRESHOLD,
+    OCR_TESSERACT_VARIABLES,
+    OCR_USE_TESSEROCR,
+    TEXT_REGIONS,
+    UI_TEXTS,
+    WAIT_CHANGE_THRESHOLD,
+    WAIT_EASYOCR_AFTER,
+    WAIT_POLL_GROWTH,
+    WAIT_POLL_INITIAL,
+    WAIT_POLL_MAX,
 )
 from .logger import get_logger
-from .utils import xywh_to_ltrb
+from .ocr_numba import HAVE_NUMBA, find_pair
+from .screen_capture import grab, screen_size, to_image
 
 logger = get_logger(__name__)
 
+# pyautogui sleeps PAUSE seconds after every call. Clicks here are followed by
+# explicit waits, so the blanket pause only slows each workflow step down.
+# FAILSAFE stays enabled so a run can still be aborted from the screen corner.
+pyautogui.PAUSE = 0
+
+# Column layout of ``pytesseract.image_to_data(..., output_type=DATAFRAME)``
+TESSERACT_COLUMNS = [
+    "level",
+    "page_num",
+    "block_num",
+    "par_num",
+    "line_num",
+    "word_num",
+    "left",
+    "top",
+    "width",
+    "height",
+    "conf",
+    "text",
+]
+
+# Structuring element for the open/close cleanup in _preprocess_image
+_MORPH_KERNEL = np.ones((3, 3), np.uint8)
+
+# Regions whose latest capture is kept for failure screenshots
+LAST_CAPTURES_KEPT = 8
+
+# Compact dtypes for OCR word tables; ``level`` and ``word_num`` are not used
+# downstream and are dropped
+_WORD_DTYPES = {
+    "page_num": np.int16,
+    "block_num": np.int16,
+    "par_num": np.int16,
+    "line_num": np.int16,
+    "left": np.int32,
+    "top": np.int32,
+    "width": np.int32,
+    "height": np.int32,
+    "conf": np.float32,
+    "text": "string",
+}
+
+
+def _typed_words(df: pd.DataFrame) -> pd.DataFrame:
+    """Return ``df`` with only the used word columns, in compact dtypes."""
+    df = df.drop(columns=["level", "word_num"], errors="ignore")
+    return df.astype({col: t for col, t in _WORD_DTYPES.items() if col in df})
+
+
+# PIL modes tesserocr can take as raw bytes, with their bytes per pixel
+_RAW_IMAGE_MODES = {"L": 1, "RGB": 3, "RGBA": 4}
+
+try:
+    _CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):  # OpenCV built without CUDA
+    _CUDA_AVAILABLE = False
+
 
 class ScreenshotError(Exception):
     """Raised when a screenshot cannot be captured."""
@@ -41,72 +136,311 @@ class ScreenshotError(Exception):
 
 def demojibake(s: str) -> str:
     """Fix mojibake by re-decoding Latin-1 bytes as UTF-8."""
+    if s.isascii():  # nothing to repair; the common case for menu text
+        return s
     try:
         return s.encode("latin-1").decode("utf-8")
-    except Exception:
+    except UnicodeError:
         return s
 
 
+_TR_TRANS = str.maketrans("İIıŞşĞğÇçÖöÜü", "IIiSsGgCcOoUu")
+_DASH_RE = re.compile(r"[-–—−-]")
+_WS_RE = re.compile(r"\s+")
+# OCR confuses "Ö" with "0"/"G"; fold them together for fuzzy matching
+_OCR_CONFUSION_TRANS = str.maketrans("0g", "oo")
+
+
+# OCR tokens repeat heavily across polls and screens; one normalization each
+@lru_cache(maxsize=65536)
 def normalize_tr(s: str) -> str:
     """Normalize Turkish text for case-insensitive comparisons.
 
     Converts Turkish-specific characters to their closest ASCII
     equivalents, collapses consecutive whitespace into a single space
     and lowercases the result. Other characters are preserved.
+
+    Examples
+    --------
+    >>> normalize_tr("İzle") == normalize_tr("IZLE") == normalize_tr("izle") == "izle"
+    True
     """
 
     s = demojibake(s)
-    s = unicodedata.normalize("NFKD", s)
-    s = s.translate(str.maketrans("İIıŞşĞğÇçÖöÜü", "IIiSsGgCcOoUu"))
-    s = re.sub(r"[-–—−-]", "-", s)
-    s = re.sub(r"\s+", " ", s).strip().lower()
-    return s
+    # Fold before NFKD: decomposition would split "İ" into "I" + U+0307 and
+    # the translation table would never see the precomposed letter
+    s = unicodedata.normalize("NFKD", s.translate(_TR_TRANS))
+    # Text that arrives already decomposed still carries the dot above
+    s = _DASH_RE.sub("-", s.replace("\u0307", ""))
+    return _WS_RE.sub(" ", s).strip().lower()
+
+
+# Spellings OCR returns for the Preston "Finans - İzle" menu words
+_FINANS_VARIANTS = ("Finans", "finans", "FINANS")
+_IZLE_VARIANTS = ("İzle", "izle", "IZLE", "Izle")
+
+
+@lru_cache(maxsize=64)
+def _word_targets(word: str) -> frozenset[str]:
+    """Return the normalized forms ``word`` may take in OCR output."""
+    norm = normalize_tr(word)
+    if norm == "finans":
+        variants = _FINANS_VARIANTS
+    elif norm == "izle":
+        variants = _IZLE_VARIANTS
+    else:
+        variants = (word, word.lower(), word.upper())
+    return frozenset(normalize_tr(v) for v in variants)
+
+
+# Normalized UI text variants mapped to their ``TEXT_REGIONS`` entry
+_TEXT_REGION_KEYS = {
+    normalize_tr(variant): key
+    for key, value in UI_TEXTS.items()
+    if key in TEXT_REGIONS
+    for variant in ([value] if isinstance(value, str) else value)
+}
+
+
+def default_text_region(variants: Iterable[str]) -> Optional[Tuple[int, int, int, int]]:
+    """Return the configured screen region for a well-known UI text.
+
+    Parameters
+    ----------
+    variants:
+        Text variants being searched for.
+
+    Returns
+    -------
+    Tuple[int, int, int, int] | None
+        ``(x, y, width, height)`` in screen pixels, or ``None`` when none of
+        the variants belongs to a ``UI_TEXTS`` entry with a known region.
+    """
+    for variant in variants:
+        key = _TEXT_REGION_KEYS.get(normalize_tr(variant))
+        if key is not None:
+            screen_w, screen_h = pyautogui.size()
+            left, top, width, height = TEXT_REGIONS[key]
+            return (
+                int(left * screen_w),
+                int(top * screen_h),
+                int(width * screen_w),
+                int(height * screen_h),
+            )
+    return None
 
 
-def flexible_text_match(a: str, b: str, threshold: float = 0.8) -> bool:
-    """Perform exact, partial and fuzzy matching between two strings.
+@lru_cache(maxsize=4096)
+def precompute_variants(text: str) -> frozenset[str]:
+    """Return the normalized case variants of ``text`` used for fuzzy matching.
 
-    Tries both upper- and lower-case variants, treats Turkish ``İ``/``i``
-    as equivalent and handles common OCR confusions between ``Ö`` and
-    ``G``/``0`` characters.
+    Compute these once for a fixed target and pass them to
+    :func:`flexible_text_match_precomputed` for every candidate token.
     """
+    variants = set()
+    for form in {text, text.lower(), text.upper()}:
+        variants.add(normalize_tr(form).translate(_OCR_CONFUSION_TRANS))
+    return frozenset(variants)
 
-    def canonical_variants(text: str) -> set[str]:
-        forms = {text, text.lower(), text.upper()}
-        variants: set[str] = set()
-        for form in forms:
-            norm = normalize_tr(form)
-            norm = norm.replace("0", "o").replace("g", "o")
-            variants.add(norm)
-        return variants
 
-    a_vars = canonical_variants(a)
-    b_vars = canonical_variants(b)
+def flexible_text_match_precomputed(
+    a_vars: frozenset[str], b_vars: frozenset[str], threshold: float = 0.8
+) -> bool:
+    """Match two sets of :func:`precompute_variants` output.
 
+    Exact, substring and RapidFuzz ratio matches are tried for every pair.
+    """
+    cutoff = threshold * 100
     for av in a_vars:
         for bv in b_vars:
             if av == bv or av in bv or bv in av:
                 return True
-            if SequenceMatcher(None, av, bv).ratio() >= threshold:
+            if fuzz.ratio(av, bv, score_cutoff=cutoff):
                 return True
     return False
 
 
+def flexible_text_match(a: str, b: str, threshold: float = 0.8) -> bool:
+    """Perform exact, partial and fuzzy matching between two strings.
+
+    Tries both upper- and lower-case variants, treats Turkish ``İ``/``i``
+    as equivalent and handles common OCR confusions between ``Ö`` and
+    ``G``/``0`` characters.
+    """
+    return flexible_text_match_precomputed(
+        precompute_variants(a), precompute_variants(b), threshold
+    )
+
+
+def _group_lines(df: pd.DataFrame) -> list[Tuple[str, int, int, int, int]]:
+    """Group OCR words into text lines.
+
+    Words are keyed by their ``page_num``/``block_num``/``par_num``/``line_num``
+    columns (missing columns count as ``0``) and bounding boxes are merged with
+    NumPy reductions instead of per-word Python bookkeeping.
+
+    Returns
+    -------
+    list[Tuple[str, int, int, int, int]]
+        ``(text, x, y, width, height)`` per line in OCR image coordinates,
+        ordered by the first appearance of each line in ``df``.
+    """
+    words = df["text"].astype(str)
+    mask = (words.str.strip() != "").to_numpy()
+    df = df[mask]
+    if df.empty:
+        return []
+    n = len(df)
+    keys = np.stack(
+        [
+            df[col].to_numpy() if col in df else np.zeros(n, np.int16)
+            for col in ("page_num", "block_num", "par_num", "line_num")
+        ],
+        axis=1,
+    )
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    rank = np.empty(len(first), dtype=np.int64)
+    rank[np.argsort(first)] = np.arange(len(first))
+    word_line = rank[inverse.ravel()]
+    order = np.argsort(word_line, kind="stable")
+    starts = np.flatnonzero(np.diff(word_line[order], prepend=-1))
+
+    left = df["left"].to_numpy()[order]
+    top = df["top"].to_numpy()[order]
+    right = left + df["width"].to_numpy()[order]
+    bottom = top + df["height"].to_numpy()[order]
+    x = np.minimum.reduceat(left, starts)
+    y = np.minimum.reduceat(top, starts)
+    w = np.maximum.reduceat(right, starts) - x
+    h = np.maximum.reduceat(bottom, starts) - y
+    texts = np.split(words.to_numpy()[mask][order], starts[1:])
+    return [
+        (" ".join(line), int(lx), int(ly), int(lw), int(lh))
+        for line, lx, ly, lw, lh in zip(texts, x, y, w, h)
+    ]
+
+
+def _assign_line_numbers(df: pd.DataFrame, gap: int = 10) -> pd.DataFrame:
+    """Sort words by ``top`` and number them into text lines.
+
+    A new line starts wherever the vertical jump from the previous word is
+    more than ``gap`` pixels. Returns a new frame with a ``line_num`` column
+    (starting at 1) and a fresh ``RangeIndex``.
+    """
+    df = df.sort_values("top").reset_index(drop=True)
+    tops = df["top"].to_numpy(dtype=np.int32, copy=False)
+    diffs = np.empty_like(tops)
+    if len(tops):
+        diffs[0] = gap + 1
+        np.subtract(tops[1:], tops[:-1], out=diffs[1:])
+    df["line_num"] = (diffs > gap).cumsum(dtype=np.int32)
+    return df
+
+
+def _pair_rows(
+    df: pd.DataFrame,
+    left_targets: frozenset[str],
+    right_targets: frozenset[str],
+    max_gap: int,
+) -> Optional[Tuple[Any, Any]]:
+    """Return the ``(left, right)`` rows of the first word pair on one line.
+
+    ``df`` needs ``ntext``, ``line_num`` and ``left`` columns; the search
+    itself runs in :func:`ocr_numba.find_pair` on plain arrays.
+    """
+    li, ri = find_pair(
+        df["line_num"].to_numpy(dtype=np.int64),
+        df["left"].to_numpy(dtype=np.int64),
+        df["ntext"].isin(left_targets).to_numpy(),
+        df["ntext"].isin(right_targets).to_numpy(),
+        max_gap,
+    )
+    if li < 0:
+        return None
+    rows = df.iloc[[li, ri]].itertuples(index=False)
+    return next(rows), next(rows)
+
+
 class OCREngine:
-    def __init__(self, debug: bool = False):
+    # EasyOCR readers keyed by (languages, gpu), shared by all engines so the
+    # detection and recognition weights are loaded once per process
+    _READER_CACHE: dict[tuple, "easyocr.Reader"] = {}
+    _READER_LOCK = threading.Lock()
+
+    @classmethod
+    def _get_reader(cls, langs: Tuple[str, ...]) -> Optional["easyocr.Reader"]:
+        """Return the shared EasyOCR reader for ``langs``, creating it once.
+
+        Set ``PRESTON_OCR_GPU=1`` to run EasyOCR on the GPU.
+        """
+        gpu = bool(int(os.environ.get("PRESTON_OCR_GPU", "0")))
+        key = (langs, gpu)
+        with cls._READER_LOCK:
+            reader = cls._READER_CACHE.get(key)
+            if reader is None:
+                try:
+                    reader = easyocr.Reader(
+                        list(langs), gpu=gpu, cudnn_benchmark=True
+                    )
+                except Exception as exc:
+                    logger.warning("EasyOCR initialization failed: %s", exc)
+                    return None
+                cls._READER_CACHE[key] = reader
+        return reader
+
+    def __init__(self, debug: bool = False, preprocess: bool = True):
         self.lang = OCR_LANGUAGE
         self.debug = debug
-        self.tesseract_lang = "tur"
-        try:
-            self.easyocr_reader = easyocr.Reader(["tr", "en"], gpu=False)
-        except Exception as exc:
-            logger.warning("EasyOCR initialization failed: %s", exc)
-            self.easyocr_reader = None
+        # Set to False to OCR the plain grayscale capture, skipping the
+        # upscale/binarize pipeline of _preprocess_image
+        self.preprocess = preprocess
+        self.easyocr_reader = OCREngine._get_reader(("tr", "en"))
+
+        # Tesseract instances with the language model loaded, created lazily
+        # per thread (the API is not thread-safe) instead of spawning
+        # ``tesseract`` for every pytesseract call.
+        self._lock = threading.Lock()
+        self._tess_local = threading.local()
+        self._tess_apis: list = []
+        # Initialised APIs released by warm_up(), adopted by the next thread
+        self._tess_idle: list = []
+        # Per-thread scratch arrays for _preprocess_image
+        self._buf_local = threading.local()
+        # Background writer for debug files (PNG encoding dominates otherwise)
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="ocr-debug"
+        )
 
         # Legacy attributes for backward compatibility
         self.use_easyocr = False
         self.reader = None
 
+        # (time, image, words, text) OCR results keyed by a hash of the
+        # captured pixels; entries expire after OCR_CACHE_TTL seconds
+        self._ocr_cache: OrderedDict = OrderedDict()
+
+        # Last BGRA capture per requested region, for failure reports
+        self._last_rois: OrderedDict = OrderedDict()
+        # Last words recognized by any fresh OCR pass, for failure reports
+        self.recent_tokens: deque[str] = deque(maxlen=20)
+
+        # find_text_on_screen results keyed by (OCR cache key, region,
+        # targets, confidence, normalize)
+        self._match_cache: OrderedDict = OrderedDict()
+
+        # Median word height (screen pixels) seen on the last OCR pass; used
+        # to decide whether preprocessing needs to upscale the screenshot.
+        self._text_height = 0.0
+        # time.monotonic() of the last Preston activation done by _capture
+        self._focused_at = float("-inf")
+        self._gpu_lock = threading.Lock()
+        self._gpu_src = self._gpu_blur = None
+        if _CUDA_AVAILABLE:
+            self._gpu_src = cv2.cuda_GpuMat()
+            self._gpu_blur = cv2.cuda.createGaussianFilter(
+                cv2.CV_8UC1, cv2.CV_8UC1, (5, 5), 0
+            )
+
         # Create base debug directory and a timestamped run directory
         self.debug_root = Path("debug_screenshots")
         self.debug_root.mkdir(exist_ok=True)
@@ -116,13 +450,184 @@ class OCREngine:
         self.step = 0
         self.log_file = self.run_dir / "ocr_log.txt"
 
+    def close(self) -> None:
+        """Finish pending debug writes and release the Tesseract APIs."""
+        pool = getattr(self, "_io_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=True)
+        apis = getattr(self, "_tess_apis", None)
+        if not apis:
+            return
+        with self._lock:
+            self._tess_apis = []
+            self._tess_idle = []
+            self._tess_local = threading.local()
+        for api in apis:
+            api.End()
+
+    def _tesseract_api(self):
+        """Return the calling thread's tesserocr API, or ``None`` for pytesseract."""
+        if not OCR_USE_TESSEROCR or PyTessBaseAPI is None:
+            return None
+        local = self._tess_local
+        api = getattr(local, "api", None)
+        if api is None and self._tess_idle:
+            with self._lock:
+                api = self._tess_idle.pop() if self._tess_idle else None
+            local.api = api
+        if api is None and not getattr(local, "failed", False):
+            try:
+                api = PyTessBaseAPI(
+                    lang="tur+eng", psm=PSM.SINGLE_LINE, oem=OEM.LSTM_ONLY
+                )
+                for name, value in OCR_TESSERACT_VARIABLES.items():
+                    api.SetVariable(name, value)
+            except Exception as exc:
+                logger.warning("tesserocr initialization failed: %s", exc)
+                local.failed = True
+                return None
+            local.api = api
+            with self._lock:
+                self._tess_apis.append(api)
+        return api
+
+    def warm_up(self) -> None:
+        """Pay the one-time model loading cost before the first real search.
+
+        Runs one OCR pass on a blank image with each available backend. The
+        Tesseract API loaded here is handed to whichever thread OCRs next, so
+        warming up from a background thread still benefits the worker.
+        """
+        blank = np.full((32, 32), 255, dtype=np.uint8)
+        start = time.perf_counter()
+        try:
+            if self.easyocr_reader is not None:
+                # A batch of two exercises the batched path used by
+                # find_texts_in_regions; the models are shared with readtext
+                self.easyocr_reader.readtext_batched([blank, blank])
+            self._tesseract_ocr(blank)
+            if HAVE_NUMBA:
+                # Compiles (or loads from Numba's disk cache) the pair kernel
+                one = np.zeros(1, dtype=np.int64)
+                flag = np.zeros(1, dtype=bool)
+                find_pair(one, one, flag, flag, 1)
+        except Exception as exc:
+            logger.warning("OCR warm-up failed: %s", exc)
+        local = self._tess_local
+        api = getattr(local, "api", None)
+        if api is not None:
+            local.api = None
+            with self._lock:
+                self._tess_idle.append(api)
+        logger.info("OCR engine warmed up in %.2fs", time.perf_counter() - start)
+
+    def _next_step_label(self, step_name: str) -> str:
+        with self._lock:
+            self.step += 1
+            return f"step{self.step:02d}_{step_name}"
+
+    def __enter__(self) -> "OCREngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def _save_debug_image(self, img, name: str) -> None:
-        """Save screenshot for debugging purposes inside the run directory."""
+        """Save screenshot for debugging purposes inside the run directory.
+
+        Nothing is written unless the engine runs in debug mode.
+        """
+        if not self.debug:
+            return
+        self._io_pool.submit(self._write_debug_image, img, name)
+
+    def _write_debug_image(self, img, name: str) -> None:
         try:
+            if isinstance(img, np.ndarray):
+                img = Image.fromarray(img)
             img.save(self.run_dir / f"{name}.png")
         except Exception as exc:
             logger.error("Failed to save debug image: %s", exc)
 
+    @staticmethod
+    def _preston_active() -> bool:
+        window = gw.getActiveWindow()
+        return window is not None and "Preston" in (window.title or "")
+
+    def _focus_preston(self) -> None:
+        """Bring Preston to the front unless it recently had and still has focus.
+
+        After ``activate()`` the active window is polled until Preston owns
+        it (at most ``FOCUS_SETTLE_TIMEOUT``) instead of sleeping blindly.
+        """
+        if time.monotonic() - self._focused_at < FOCUS_TTL and self._preston_active():
+            return
+        windows = gw.getWindowsWithTitle("Preston")
+        if not windows:
+            return
+        windows[0].activate()
+        deadline = time.monotonic() + FOCUS_SETTLE_TIMEOUT
+        while not self._preston_active() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self._focused_at = time.monotonic()
+
+    def _capture(self, region=None, region_pad: int = 0, full_frame: bool = True):
+        """Bring Preston to the front and grab the screen.
+
+        With ``full_frame=False`` only the (padded) region is copied off the
+        screen and ``frame`` is ``None``.
+
+        Returns
+        -------
+        tuple
+            ``(frame, roi, region_used)``: the full BGRA frame, the BGRA
+            pixels of the (padded) region and that region as
+            ``(x, y, w, h)``, or ``None`` when the full screen was requested.
+        """
+        self._focus_preston()
+
+        if not region:
+            frame = grab()
+            return frame, frame, None
+        x, y, w, h = region
+        if region_pad:
+            x = max(0, x - region_pad)
+            y = max(0, y - region_pad)
+            w += region_pad * 2
+            h += region_pad * 2
+        if full_frame:
+            frame = grab()
+            roi = frame[y : y + h, x : x + w]
+        else:
+            screen_w, screen_h = screen_size()
+            frame = None
+            roi = grab((x, y, min(w, screen_w - x), min(h, screen_h - y)))
+        self._remember(region, roi)
+        # Report the region as clipped to the screen so OCR coordinates
+        # scale back correctly for regions reaching past an edge
+        return frame, roi, (x, y, roi.shape[1], roi.shape[0])
+
+    def _remember(self, region, roi: np.ndarray) -> None:
+        """Keep ``roi`` as the latest capture of ``region`` (a few regions only)."""
+        with self._lock:
+            self._last_rois[tuple(region)] = roi
+            self._last_rois.move_to_end(tuple(region))
+            if len(self._last_rois) > LAST_CAPTURES_KEPT:
+                self._last_rois.popitem(last=False)
+
+    def last_capture(self, region) -> Optional[np.ndarray]:
+        """Return the BGRA pixels last captured for ``region``, if any."""
+        if not region:
+            return None
+        with self._lock:
+            return self._last_rois.get(tuple(region))
+
     def capture_image(self, region=None, step_name: str = "step", region_pad: int = 0):
         """Capture a screenshot and save the raw image without running OCR.
 
@@ -145,166 +650,403 @@ class OCREngine:
         """
 
         try:
-            self.step += 1
-            step_label = f"step{self.step:02d}_{step_name}"
-
-            windows = gw.getWindowsWithTitle("Preston")
-            if windows:
-                windows[0].activate()
-                time.sleep(0.3)
-
-            img = pyautogui.screenshot()
-            if region:
-                x, y, w, h = region
-                if region_pad:
-                    x = max(0, x - region_pad)
-                    y = max(0, y - region_pad)
-                    w += region_pad * 2
-                    h += region_pad * 2
-                img = img.crop(xywh_to_ltrb((x, y, w, h)))
-
-            img.save(self.run_dir / f"{step_label}_raw.png")
+            step_label = self._next_step_label(step_name)
+
+            _, roi, _ = self._capture(region, region_pad, full_frame=False)
+            img = to_image(roi)
+            # Encoded in the background; the image wraps a fresh capture
+            self._io_pool.submit(img.save, self.run_dir / f"{step_label}_raw.png")
             return img
         except Exception as exc:
             logger.error("Capture image failed: %s", exc)
             return None
 
-    def _screenshot(self, region=None, step_name: str = "step", region_pad: int = 0):
+    def _screenshot(
+        self,
+        region=None,
+        step_name: str = "step",
+        region_pad: int = 0,
+        use_easyocr: Optional[bool] = None,
+        fast: bool = False,
+    ):
+        if fast:
+            reader = None
+        elif use_easyocr is None:
+            reader = self.reader if self.use_easyocr else None
+        else:
+            reader = self.easyocr_reader if use_easyocr else None
         try:
-            self.step += 1
-            step_label = f"step{self.step:02d}_{step_name}"
-
-            windows = gw.getWindowsWithTitle("Preston")
-            if windows:
-                windows[0].activate()
-                time.sleep(0.3)
-
-            # Capture full screen for region overlay
-            full_img = pyautogui.screenshot()
-            if region:
-                x, y, w, h = region
-                if region_pad:
-                    x = max(0, x - region_pad)
-                    y = max(0, y - region_pad)
-                    w += region_pad * 2
-                    h += region_pad * 2
-                raw_img = full_img.crop(xywh_to_ltrb((x, y, w, h)))
+            step_label = self._next_step_label(step_name)
+
+            # The full frame is only needed for the debug region overlay
+            frame, roi, region_used = self._capture(
+                region, region_pad, full_frame=self.debug and bool(region)
+            )
+
+            # The Preston UI is mostly static between polls, so identical
+            # pixels are answered from the cache instead of re-running OCR.
+            key = (
+                self._frame_digest(roi),
+                roi.shape,
+                reader is not None,
+                self.preprocess,
+                fast,
+            )
+            cached = self._cache_get(key)
+            if cached is not None:
+                processed_img, df, ocr_text = cached
             else:
-                raw_img = full_img
-
-            processed_img = self._preprocess_image(raw_img)
-
-            # Save raw and processed images
-            raw_img.save(self.run_dir / f"{step_label}_raw.png")
-            processed_img.save(self.run_dir / f"{step_label}_processed.png")
-
-            if self.use_easyocr and self.reader:
-                results = self.reader.readtext(np.array(processed_img))
-                data = []
-                text_lines = []
-                for bbox, text, conf in results:
-                    x_coords = [pt[0] for pt in bbox]
-                    y_coords = [pt[1] for pt in bbox]
-                    left = int(min(x_coords))
-                    top = int(min(y_coords))
-                    width = int(max(x_coords) - left)
-                    height = int(max(y_coords) - top)
-                    data.append(
-                        {
-                            "left": left,
-                            "top": top,
-                            "width": width,
-                            "height": height,
-                            "text": text,
-                            "conf": conf * 100,
-                        }
-                    )
-                    text_lines.append(text)
-                if not data:
-                    df = pd.DataFrame(
-                        columns=[
-                            "left",
-                            "top",
-                            "width",
-                            "height",
-                            "text",
-                            "conf",
-                            "line_num",
-                        ]
-                    )
+                if fast:
+                    processed_img = self._fast_image(roi)
+                    ocr_text, df = self._tesseract_ocr(processed_img, fast=True)
                 else:
-                    df = pd.DataFrame(data)
-                    df.sort_values("top", inplace=True)
-                    line_num = 0
-                    last_top = -9999
-                    for idx, row in df.iterrows():
-                        if row.top - last_top > 10:
-                            line_num += 1
-                            last_top = row.top
-                        df.at[idx, "line_num"] = line_num
-                ocr_text = "\n".join(text_lines)
-            else:
-                ocr_text = pytesseract.image_to_string(
-                    processed_img, lang="tur+eng", config=OCR_TESSERACT_CONFIG
-                )
-                df = pytesseract.image_to_data(
+                    processed_img = self._ocr_image(roi)
+                    ocr_text, df = self._run_ocr(processed_img, reader)
+                df = self._cache_put(key, roi, processed_img, df, ocr_text)
+
+            df.attrs["ocr_key"] = key
+
+            if self.debug:
+                # Written in the background so encoding overlaps the next OCR
+                self._io_pool.submit(
+                    self._write_debug_files,
+                    step_label,
+                    roi,
                     processed_img,
-                    lang="tur+eng",
-                    config=OCR_TESSERACT_CONFIG,
-                    output_type=pytesseract.Output.DATAFRAME,
-                ).dropna(subset=["text"])
+                    frame,
+                    region_used,
+                    ocr_text,
+                    df.copy(),
+                )
+
+            if self.debug and not df.empty:
+                self._log_words(step_label, df, processed_img, roi, region_used)
+
+            return processed_img, df, step_label, region_used
+        except Exception as exc:
+            logger.error("Screenshot failed: %s", exc)
+            raise ScreenshotError("Unable to capture screenshot") from exc
 
+    def _log_words(self, step_label: str, df, processed_img, roi, region_used) -> None:
+        """Append the OCR words of one step, in screen coordinates, to the log."""
+        # OCR coordinates are based on the scaled ``processed_img``; convert
+        # them back to screen space so the log reflects real cursor locations.
+        roi_h, roi_w = roi.shape[:2]
+        scale_x = processed_img.shape[1] / roi_w if roi_w else 1
+        scale_y = processed_img.shape[0] / roi_h if roi_h else 1
+        off_x, off_y = region_used[:2] if region_used else (0, 0)
+        left = (df["left"].to_numpy() / scale_x + off_x).astype(int)
+        top = (df["top"].to_numpy() / scale_y + off_y).astype(int)
+        width = (df["width"].to_numpy() / scale_x).astype(int)
+        height = (df["height"].to_numpy() / scale_y).astype(int)
+        lines = "".join(
+            f"{step_label}: {text} (conf={conf}, x={x}, y={y}, w={w}, h={h})\n"
+            for text, conf, x, y, w, h in zip(
+                df["text"], df["conf"], left, top, width, height
+            )
+        )
+        with open(self.log_file, "a", encoding="utf-8") as log:
+            log.write(lines)
+
+    def _write_debug_files(
+        self,
+        step_label: str,
+        roi: np.ndarray,
+        processed_img: np.ndarray,
+        frame: Optional[np.ndarray],
+        region_used,
+        ocr_text: str,
+        df: pd.DataFrame,
+    ) -> None:
+        """Save the images, text and word data of one OCR step to the run dir."""
+        try:
+            to_image(roi).save(self.run_dir / f"{step_label}_raw.png")
+            Image.fromarray(processed_img).save(
+                self.run_dir / f"{step_label}_processed.png"
+            )
             with open(
                 self.run_dir / f"{step_label}_ocr_result.txt", "w", encoding="utf-8"
             ) as f:
                 f.write(ocr_text)
+            # CSV stays human-readable; these files are for inspection only
             df.to_csv(
                 self.run_dir / f"{step_label}_ocr_data.csv",
                 index=False,
                 encoding="utf-8",
             )
+            if frame is not None and region_used:
+                # Without a region the overlay would repeat the raw capture
+                overlay = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+                x, y, w, h = region_used
+                cv2.rectangle(overlay, (x, y), (x + w, y + h), (0, 0, 255), 2)
+                cv2.imwrite(str(self.run_dir / f"{step_label}_search_region.png"), overlay)
+        except Exception as exc:
+            logger.error("Failed to save debug files for %s: %s", step_label, exc)
+
+    def _cache_get(self, key) -> Optional[Tuple[np.ndarray, pd.DataFrame, str]]:
+        """Return a fresh ``(image, words, text)`` OCR result for ``key``, if cached."""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._ocr_cache.get(key)
+            if cached is None:
+                return None
+            if now - cached[0] >= OCR_CACHE_TTL:
+                del self._ocr_cache[key]
+                return None
+            self._ocr_cache.move_to_end(key)
+        _, processed_img, df, ocr_text = cached
+        return processed_img, df.copy(), ocr_text
+
+    def _cache_put(
+        self, key, roi: np.ndarray, processed_img: np.ndarray, df: pd.DataFrame, ocr_text: str
+    ) -> pd.DataFrame:
+        """Finish a fresh OCR result of ``roi`` and store it under ``key``."""
+        # Converted once here instead of by every caller
+        df["conf"] = pd.to_numeric(df["conf"], errors="coerce", downcast="float")
+        self.recent_tokens.extend(df["text"].astype(str))
+        if roi.shape[0]:
+            self._update_text_height(df, processed_img.shape[0] / roi.shape[0])
+        with self._lock:
+            self._ocr_cache[key] = (time.monotonic(), processed_img, df.copy(), ocr_text)
+            if len(self._ocr_cache) > OCR_CACHE_SIZE:
+                self._ocr_cache.popitem(last=False)
+        return df
+
+    def _ocr_image(self, roi: np.ndarray) -> np.ndarray:
+        """Return the gray image OCR runs on for a BGRA capture."""
+        if self.preprocess:
+            return self._preprocess_image(roi)
+        return cv2.cvtColor(roi, cv2.COLOR_BGRA2GRAY)
 
-            # Log texts, confidences and coordinates
-            # Convert OCR engine coordinates (which are based on the scaled
-            # ``processed_img``) back to the original screen space so that the
-            # debug log reflects real cursor locations.
-            scale_x = processed_img.width / raw_img.width if raw_img.width else 1
-            scale_y = processed_img.height / raw_img.height if raw_img.height else 1
-            with open(self.log_file, "a", encoding="utf-8") as log:
-                for row in df.itertuples(index=False):
-                    reg_left = row.left / scale_x
-                    reg_top = row.top / scale_y
-                    reg_w = row.width / scale_x
-                    reg_h = row.height / scale_y
-                    abs_left = int(reg_left + x) if region else int(reg_left)
-                    abs_top = int(reg_top + y) if region else int(reg_top)
-                    log.write(
-                        f"{step_label}: {row.text} (conf={row.conf}, x={abs_left}, y={abs_top}, w={int(reg_w)}, h={int(reg_h)})\n"
-                    )
-
-            # Overlay region rectangle
-            overlay = full_img.copy()
-            if region:
-                draw = ImageDraw.Draw(overlay)
-                draw.rectangle(xywh_to_ltrb((x, y, w, h)), outline="red", width=2)
-            overlay.save(self.run_dir / f"{step_label}_search_region.png")
+    @staticmethod
+    def _frame_digest(roi: np.ndarray) -> bytes:
+        """Return a cheap content hash of a captured region."""
+        return hashlib.blake2b(roi[::4, ::4].tobytes(), digest_size=8).digest()
+
+    def _update_text_height(self, df: pd.DataFrame, scale: float) -> None:
+        """Remember the median OCR word height in screen pixels."""
+        heights = pd.to_numeric(df["height"], errors="coerce").dropna()
+        if not heights.empty and scale:
+            self._text_height = float(heights.median()) / scale
+
+    def clear_cache(self) -> None:
+        """Forget cached OCR results, e.g. after interacting with the UI."""
+        with self._lock:
+            self._ocr_cache.clear()
+            self._match_cache.clear()
+
+    def _run_ocr(
+        self, processed_img: np.ndarray, reader=None
+    ) -> Tuple[str, pd.DataFrame]:
+        """Run EasyOCR with ``reader`` (or Tesseract if ``None``) on the image."""
+        if reader is not None:
+            results = reader.readtext(processed_img)
+            ocr_text, df = self._easyocr_frame(results)
+        else:
+            ocr_text, df = self._tesseract_ocr(processed_img)
+        return ocr_text, df
 
-            region_used = (x, y, w, h) if region else None
-            return processed_img, df, step_label, region_used
-        except Exception as exc:
-            logger.error("Screenshot failed: %s", exc)
-            raise ScreenshotError("Unable to capture screenshot") from exc
+    @staticmethod
+    def _easyocr_frame(results) -> Tuple[str, pd.DataFrame]:
+        """Convert EasyOCR ``readtext`` results to text and word-level data."""
+        data = []
+        text_lines = []
+        for bbox, text, conf in results:
+            x_coords = [pt[0] for pt in bbox]
+            y_coords = [pt[1] for pt in bbox]
+            left = int(min(x_coords))
+            top = int(min(y_coords))
+            width = int(max(x_coords) - left)
+            height = int(max(y_coords) - top)
+            data.append(
+                {
+                    "left": left,
+                    "top": top,
+                    "width": width,
+                    "height": height,
+                    "text": text,
+                    "conf": conf * 100,
+                }
+            )
+            text_lines.append(text)
+        if not data:
+            df = pd.DataFrame(
+                columns=[
+                    "left",
+                    "top",
+                    "width",
+                    "height",
+                    "text",
+                    "conf",
+                    "line_num",
+                ]
+            )
+        else:
+            df = _assign_line_numbers(pd.DataFrame(data))
+        ocr_text = "\n".join(text_lines)
+        return ocr_text, _typed_words(df)
 
     @staticmethod
-    def _preprocess_image(img: Image.Image) -> Image.Image:
-        gray = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2GRAY)
-        gray = cv2.resize(gray, None, fx=3, fy=3, interpolation=cv2.INTER_CUBIC)
-        gray = cv2.GaussianBlur(gray, (5, 5), 0)
-        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        kernel = np.ones((3, 3), np.uint8)
-        opened = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
-        closed = cv2.morphologyEx(opened, cv2.MORPH_CLOSE, kernel)
-        return Image.fromarray(closed)
+    def _set_api_image(api, img) -> None:
+        """Pass ``img`` to tesserocr as raw pixels.
+
+        ``SetImage`` encodes PIL images to an in-memory BMP for leptonica to
+        decode again; ``SetImageBytes`` hands the pixel buffer over directly.
+        Accepts PIL images and ``uint8`` arrays (gray, RGB or RGBA).
+        """
+        if isinstance(img, Image.Image):
+            bpp = _RAW_IMAGE_MODES.get(img.mode)
+            if bpp is None:
+                api.SetImage(img)
+                return
+            (w, h), data = img.size, img.tobytes()
+        else:
+            arr = np.ascontiguousarray(img, dtype=np.uint8)
+            h, w = arr.shape[:2]
+            bpp = 1 if arr.ndim == 2 else arr.shape[2]
+            data = arr.tobytes()
+        api.SetImageBytes(data, w, h, bpp, w * bpp)
+
+    def _tesseract_ocr(
+        self, img: np.ndarray | Image.Image, fast: bool = False, sparse: bool = False
+    ) -> Tuple[str, pd.DataFrame]:
+        """Run Tesseract on ``img`` and return its text and word-level data.
+
+        The word data mirrors the ``pytesseract`` DATAFRAME output (with empty
+        rows dropped) regardless of which backend is used. ``fast`` selects
+        ``OCR_TESSERACT_FAST_CONFIG`` for pytesseract; the dictionary
+        variables it sets only apply at init, so tesserocr ignores the flag.
+        ``sparse`` looks for text scattered over the whole image instead of
+        a single line (page segmentation mode 11).
+        """
+        api = self._tesseract_api()
+        if api is None:
+            config = OCR_TESSERACT_FAST_CONFIG if fast else OCR_TESSERACT_CONFIG
+            if sparse:
+                config = config.replace("--psm 7", "--psm 11")
+            ocr_text = pytesseract.image_to_string(img, lang="tur+eng", config=config)
+            df = pytesseract.image_to_data(
+                img,
+                lang="tur+eng",
+                config=config,
+                output_type=pytesseract.Output.DATAFRAME,
+            ).dropna(subset=["text"])
+            return ocr_text, _typed_words(df)
+
+        self._set_api_image(api, img)
+        if sparse:
+            api.SetPageSegMode(PSM.SPARSE_TEXT)
+            try:
+                api.Recognize()
+            finally:
+                # Later calls on this thread's API expect single-line mode
+                api.SetPageSegMode(PSM.SINGLE_LINE)
+        else:
+            api.Recognize()
+        ocr_text = api.GetUTF8Text()
+        rows = []
+        iterator = api.GetIterator()
+        if iterator is not None:
+            block = par = line = word = 0
+            for res in iterate_level(iterator, RIL.WORD):
+                if res.IsAtBeginningOf(RIL.BLOCK):
+                    block += 1
+                    par = line = word = 0
+                if res.IsAtBeginningOf(RIL.PARA):
+                    par += 1
+                    line = word = 0
+                if res.IsAtBeginningOf(RIL.TEXTLINE):
+                    line += 1
+                    word = 0
+                word += 1
+                text = res.GetUTF8Text(RIL.WORD)
+                bbox = res.BoundingBox(RIL.WORD)
+                if not text or bbox is None:
+                    continue
+                x1, y1, x2, y2 = bbox
+                rows.append(
+                    (
+                        5,
+                        1,
+                        block,
+                        par,
+                        line,
+                        word,
+                        x1,
+                        y1,
+                        x2 - x1,
+                        y2 - y1,
+                        res.Confidence(RIL.WORD),
+                        text,
+                    )
+                )
+        return ocr_text, _typed_words(pd.DataFrame(rows, columns=TESSERACT_COLUMNS))
+
+    def _buffer(self, name: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """Return this thread's reusable ``uint8`` scratch array ``name``.
+
+        Preprocessing runs on every poll with the same region sizes, so the
+        intermediate images are written into these buffers (via ``dst=``)
+        instead of allocating new full-size arrays each time.
+        """
+        bufs = vars(self._buf_local)
+        buf = bufs.get(name)
+        if buf is None or buf.shape != shape:
+            buf = bufs[name] = np.empty(shape, dtype=np.uint8)
+        return buf
+
+    def _fast_image(self, frame: np.ndarray) -> np.ndarray:
+        """Return a downscaled grayscale copy of a BGRA capture for the fast pass."""
+        h, w = frame.shape[:2]
+        gray = cv2.cvtColor(
+            frame, cv2.COLOR_BGRA2GRAY, dst=self._buffer("gray", (h, w))
+        )
+        size = (max(1, int(w * OCR_FAST_SCALE)), max(1, int(h * OCR_FAST_SCALE)))
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+    def _preprocess_image(self, frame: np.ndarray) -> np.ndarray:
+        """Binarize a BGRA screen capture for OCR, returning a gray array."""
+        h, w = frame.shape[:2]
+        gray = cv2.cvtColor(
+            frame, cv2.COLOR_BGRA2GRAY, dst=self._buffer("gray", (h, w))
+        )
+        # Tesseract's LSTM rescales lines internally; only upscale when the
+        # text seen on previous passes was too small to read reliably.
+        scale = (
+            1 if self._text_height >= OCR_MIN_TEXT_HEIGHT else OCR_PREPROCESS_SCALE
+        )
+        if self._gpu_src is not None:
+            with self._gpu_lock:
+                self._gpu_src.upload(gray)
+                src = self._gpu_src
+                if scale != 1:
+                    src = cv2.cuda.resize(
+                        src, (w * scale, h * scale), interpolation=cv2.INTER_LINEAR
+                    )
+                gray = self._gpu_blur.apply(src).download()
+        else:
+            if scale != 1:
+                gray = cv2.resize(
+                    gray,
+                    (w * scale, h * scale),
+                    dst=self._buffer("resized", (h * scale, w * scale)),
+                    interpolation=cv2.INTER_LINEAR,
+                )
+            gray = cv2.GaussianBlur(gray, (5, 5), 0, dst=gray)
+        _, thresh = cv2.threshold(
+            gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU, dst=gray
+        )
+        # The result is cached and handed out, so the last step writes to a
+        # fresh array rather than a scratch buffer
+        if not OCR_MORPH_CLOSE:
+            return cv2.morphologyEx(thresh, cv2.MORPH_OPEN, _MORPH_KERNEL)
+        opened = cv2.morphologyEx(
+            thresh,
+            cv2.MORPH_OPEN,
+            _MORPH_KERNEL,
+            dst=self._buffer("opened", gray.shape),
+        )
+        return cv2.morphologyEx(opened, cv2.MORPH_CLOSE, _MORPH_KERNEL)
 
     @staticmethod
     def _normalize(text: str) -> str:
@@ -328,58 +1070,39 @@ class OCREngine:
         )
         if img is None or df.empty:
             return None
-        df["conf"] = df["conf"].astype(float)
-        df["ntext"] = df["text"].map(self._normalize)
+        df["ntext"] = df["text"].astype(str).map(normalize_tr)
         df = df[df["conf"] >= conf_min]
 
-        left_norm = self._normalize(left_word)
-        right_norm = self._normalize(right_word)
-        left_variants = (
-            ["Finans", "finans", "FINANS"]
-            if left_norm == "finans"
-            else [left_word, left_word.lower(), left_word.upper()]
-        )
-        right_variants = (
-            ["İzle", "izle", "IZLE", "Izle"]
-            if right_norm == "izle"
-            else [right_word, right_word.lower(), right_word.upper()]
-        )
-        left_targets = {self._normalize(w) for w in left_variants}
-        right_targets = {self._normalize(w) for w in right_variants}
-
         # Search left word first, then look for the right word on the same line
-        left_tokens = df[df.ntext.isin(left_targets)].sort_values(["line_num", "left"])
-        for L in left_tokens.itertuples():
-            line_tokens = df[(df.line_num == L.line_num) & (df.left > L.left)]
-            line_tokens = line_tokens[line_tokens.left - L.left < max_gap]
-            right_candidates = line_tokens[line_tokens.ntext.isin(right_targets)]
-            if not right_candidates.empty:
-                R = right_candidates.iloc[0]
-
-                # Scale factors between OCR image size and original region
-                region_w = used_region[2] if used_region else window_rect[2]
-                region_h = used_region[3] if used_region else window_rect[3]
-                scale_x = img.width / region_w if region_w else 1
-                scale_y = img.height / region_h if region_h else 1
-
-                # Coordinates relative to the search region
-                rel_x = min(L.left, R.left) / scale_x
-                rel_y = min(L.top, R.top) / scale_y
-                rel_w = (
-                    max(L.left + L.width, R.left + R.width) - min(L.left, R.left)
-                ) / scale_x
-                rel_h = (
-                    max(L.top + L.height, R.top + R.height) - min(L.top, R.top)
-                ) / scale_y
-
-                # Absolute coordinates on the screen
-                base_x = used_region[0] if used_region else window_rect[0]
-                base_y = used_region[1] if used_region else window_rect[1]
-                abs_x = int(rel_x + base_x)
-                abs_y = int(rel_y + base_y)
-                abs_w = int(rel_w)
-                abs_h = int(rel_h)
-
+        pair = _pair_rows(df, _word_targets(left_word), _word_targets(right_word), max_gap)
+        if pair is not None:
+            L, R = pair
+
+            # Scale factors between OCR image size and original region
+            region_w = used_region[2] if used_region else window_rect[2]
+            region_h = used_region[3] if used_region else window_rect[3]
+            scale_x = img.shape[1] / region_w if region_w else 1
+            scale_y = img.shape[0] / region_h if region_h else 1
+
+            # Coordinates relative to the search region
+            rel_x = min(L.left, R.left) / scale_x
+            rel_y = min(L.top, R.top) / scale_y
+            rel_w = (
+                max(L.left + L.width, R.left + R.width) - min(L.left, R.left)
+            ) / scale_x
+            rel_h = (
+                max(L.top + L.height, R.top + R.height) - min(L.top, R.top)
+            ) / scale_y
+
+            # Absolute coordinates on the screen
+            base_x = used_region[0] if used_region else window_rect[0]
+            base_y = used_region[1] if used_region else window_rect[1]
+            abs_x = int(rel_x + base_x)
+            abs_y = int(rel_y + base_y)
+            abs_w = int(rel_w)
+            abs_h = int(rel_h)
+
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
                     "Word pair '%s' '%s' relative coords=%s absolute coords=%s",
                     left_word,
@@ -387,14 +1110,14 @@ class OCREngine:
                     (int(rel_x), int(rel_y), int(rel_w), int(rel_h)),
                     (abs_x, abs_y, abs_w, abs_h),
                 )
-                try:
-                    with open(self.log_file, "a", encoding="utf-8") as log:
-                        log.write(
-                            f"word_pair {left_word} {right_word}: rel=({int(rel_x)}, {int(rel_y)}, {int(rel_w)}, {int(rel_h)}) abs=({abs_x}, {abs_y}, {abs_w}, {abs_h})\n"
-                        )
-                except Exception:
-                    pass
-                return abs_x, abs_y, abs_w, abs_h
+            try:
+                with open(self.log_file, "a", encoding="utf-8") as log:
+                    log.write(
+                        f"word_pair {left_word} {right_word}: rel=({int(rel_x)}, {int(rel_y)}, {int(rel_w)}, {int(rel_h)}) abs=({abs_x}, {abs_y}, {abs_w}, {abs_h})\n"
+                    )
+            except Exception:
+                pass
+            return abs_x, abs_y, abs_w, abs_h
         if self.debug:
             self._save_debug_image(img, f"pair_not_found_{left_word}_{right_word}")
         return None
@@ -407,8 +1130,14 @@ class OCREngine:
         max_gap: int = 300,
         conf_min: float = 30,
         region_pad: int = 0,
+        expect: Iterable[str] | str | None = None,
+        expect_region=None,
     ) -> bool:
-        """Find a word pair and click the centre of their combined bounding box."""
+        """Find a word pair and click the centre of their combined bounding box.
+
+        With ``expect`` the call returns once that follow-up text is visible
+        (see :meth:`click_text`) instead of sleeping a fixed delay.
+        """
         bbox = self.find_word_pair(
             window_rect,
             left_word=left_word,
@@ -420,102 +1149,173 @@ class OCREngine:
         if bbox:
             x, y, w, h = bbox
             pyautogui.click(x + w // 2, y + h // 2)
-            time.sleep(0.1)
-            return True
+            return self._after_click(expect, expect_region)
         logger.error(
             "Word pair '%s' and '%s' not found on screen", left_word, right_word
         )
         return False
 
-    def _find_text_engine(
+    def _screen_lines(
         self,
-        targets: list[str],
-        variants: list[str],
         region,
         confidence: float,
         normalize: bool,
         region_pad: int,
         use_easyocr: bool,
         found_texts: Optional[list[str]] = None,
-    ) -> Optional[Tuple[int, int, int, int]]:
-        orig_use_easyocr = self.use_easyocr
-        orig_reader = self.reader
-        self.use_easyocr = use_easyocr and self.easyocr_reader is not None
-        self.reader = self.easyocr_reader if self.use_easyocr else None
-        try:
-            img, df, _, used_region = self._screenshot(
-                region=region, step_name="find_text", region_pad=region_pad
-            )
-        finally:
-            self.use_easyocr = orig_use_easyocr
-            self.reader = orig_reader
+    ) -> Tuple[Optional[Image.Image], list[Tuple[str, Tuple[int, int, int, int]]]]:
+        """Run one OCR pass and return the processed image and its text lines.
+
+        Each line is ``(normalized_text, (x, y, width, height))`` with the box
+        in screen coordinates.
+        """
+        img, df, _, used_region = self._screenshot(
+            region=region,
+            step_name="find_text",
+            region_pad=region_pad,
+            use_easyocr=use_easyocr,
+        )
         if img is None or df.empty:
-            return None
+            return None, []
 
+        return img, self._df_lines(
+            df, img.shape[1::-1], used_region, confidence, normalize, found_texts
+        )
+
+    def _df_lines(
+        self,
+        df: pd.DataFrame,
+        img_size: Tuple[int, int],
+        used_region,
+        confidence: float,
+        normalize: bool,
+        found_texts: Optional[list[str]] = None,
+    ) -> list[Tuple[str, Tuple[int, int, int, int]]]:
+        """Group OCR words of an ``img_size`` image into normalized screen lines."""
+        img_w, img_h = img_size
         # Determine scale factors between the processed image fed to the OCR
         # engine and the original region so that OCR coordinates can be mapped
         # back to screen coordinates. ``used_region`` contains the original
         # region dimensions (including any padding) in screen space.
         if used_region:
             region_w, region_h = used_region[2], used_region[3]
-            scale_x = img.width / region_w if region_w else 1
-            scale_y = img.height / region_h if region_h else 1
+            scale_x = img_w / region_w if region_w else 1
+            scale_y = img_h / region_h if region_h else 1
         else:
             screen_w, screen_h = pyautogui.size()
-            scale_x = img.width / screen_w if screen_w else 1
-            scale_y = img.height / screen_h if screen_h else 1
+            scale_x = img_w / screen_w if screen_w else 1
+            scale_y = img_h / screen_h if screen_h else 1
 
-        df["conf"] = df["conf"].astype(float)
         df = df[df["conf"] >= confidence * 100]
-        lines: dict = {}
-        for row in df.itertuples(index=False):
-            if not str(row.text).strip():
-                continue
-            page_num = getattr(row, "page_num", 0)
-            block_num = getattr(row, "block_num", 0)
-            par_num = getattr(row, "par_num", 0)
-            line_num = getattr(row, "line_num", 0)
-            key = (page_num, block_num, par_num, line_num)
-            line = lines.setdefault(
-                key,
-                {"words": [], "left": [], "top": [], "right": [], "bottom": []},
-            )
-            line["words"].append(row.text)
-            left, top, width, height = row.left, row.top, row.width, row.height
-            line["left"].append(left)
-            line["top"].append(top)
-            line["right"].append(left + width)
-            line["bottom"].append(top + height)
-        for line in lines.values():
-            line_text = " ".join(line["words"])
+        lines = []
+        for line_text, x, y, w, h in _group_lines(df):
             if found_texts is not None:
                 found_texts.append(line_text)
             line_norm = (
                 self._normalize(line_text) if normalize else line_text.casefold()
             )
-            for target in targets:
-                ratio = SequenceMatcher(None, line_norm, target).ratio()
-                if target in line_norm or ratio >= OCR_FUZZY_THRESHOLD:
-                    x = min(line["left"])
-                    y = min(line["top"])
-                    w = max(line["right"]) - x
-                    h = max(line["bottom"]) - y
-
-                    # Map bounding box from processed image coordinates back
-                    # to the original screenshot region.
-                    x = int(x / scale_x)
-                    y = int(y / scale_y)
-                    w = int(w / scale_x)
-                    h = int(h / scale_y)
-
-                    if used_region:
-                        x += used_region[0]
-                        y += used_region[1]
-                    return x, y, w, h
-        if self.debug and variants:
+            # Map bounding box from processed image coordinates back to the
+            # original screenshot region.
+            x = int(x / scale_x)
+            y = int(y / scale_y)
+            w = int(w / scale_x)
+            h = int(h / scale_y)
+            if used_region:
+                x += used_region[0]
+                y += used_region[1]
+            lines.append((line_norm, (x, y, w, h)))
+        return lines
+
+    @staticmethod
+    def _match_lines(
+        targets: list[str], lines: list[Tuple[str, Tuple[int, int, int, int]]]
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Return the box of the first line containing or resembling a target.
+
+        A line matches when it equals a target, resembles it as a whole
+        (``ratio``) or contains an approximate copy of it (``partial_ratio``,
+        only for lines at least as long as the target so that short OCR
+        fragments do not match everything).
+        """
+        if not lines or not targets:
+            return None
+        target_set = set(targets)
+        line_norms = [line_norm for line_norm, _ in lines]
+        cutoff = OCR_FUZZY_THRESHOLD * 100
+        # Score every line against every target in one call per scorer;
+        # entries below the cutoff come back as 0
+        whole = process.cdist(
+            line_norms, targets, scorer=fuzz.ratio, score_cutoff=cutoff
+        )
+        partial = process.cdist(
+            line_norms, targets, scorer=fuzz.partial_ratio, score_cutoff=cutoff
+        )
+        line_lens = np.array([len(t) for t in line_norms])
+        target_lens = np.array([len(t) for t in targets])
+        partial[line_lens[:, None] < target_lens[None, :]] = 0
+        hits = whole.any(axis=1) | partial.any(axis=1)
+        for (line_norm, bbox), hit in zip(lines, hits):
+            if hit or line_norm in target_set:
+                return bbox
+        return None
+
+    def _find_text_engine(
+        self,
+        targets: list[str],
+        variants: list[str],
+        region,
+        confidence: float,
+        normalize: bool,
+        region_pad: int,
+        use_easyocr: bool,
+        found_texts: Optional[list[str]] = None,
+        fast: bool = False,
+    ) -> Optional[Tuple[int, int, int, int]]:
+        img, df, _, used_region = self._screenshot(
+            region=region,
+            step_name="find_text",
+            region_pad=region_pad,
+            use_easyocr=use_easyocr,
+            fast=fast,
+        )
+        if img is None or df.empty:
+            return None
+
+        # Polls of an unchanged region get the same OCR words back; their
+        # match result is reused instead of regrouping and rescoring lines
+        memo = (
+            df.attrs.get("ocr_key"),
+            used_region,
+            tuple(targets),
+            confidence,
+            normalize,
+        )
+        with self._lock:
+            cached = self._match_cache.get(memo)
+            if cached is not None:
+                self._match_cache.move_to_end(memo)
+        if cached is not None:
+            bbox, line_texts = cached
+            if found_texts is not None:
+                found_texts.extend(line_texts)
+            return bbox
+
+        line_texts: list[str] = []
+        lines = self._df_lines(
+            df, img.shape[1::-1], used_region, confidence, normalize, line_texts
+        )
+        if found_texts is not None:
+            found_texts.extend(line_texts)
+        bbox = self._match_lines(targets, lines)
+        if memo[0] is not None:
+            with self._lock:
+                self._match_cache[memo] = (bbox, line_texts)
+                if len(self._match_cache) > OCR_RESULT_CACHE_SIZE:
+                    self._match_cache.popitem(last=False)
+        if bbox is None and self.debug and variants:
             miss = self._normalize(variants[0]) if normalize else variants[0].casefold()
             self._save_debug_image(img, f"not_found_{miss}")
-        return None
+        return bbox
 
     def find_text_on_screen(
         self,
@@ -525,13 +1325,28 @@ class OCREngine:
         normalize: bool = True,
         region_pad: int = 0,
         texts_out: Optional[list[str]] = None,
+        use_easyocr: bool = True,
+        fast: bool = False,
     ) -> Optional[Tuple[int, int, int, int]]:
-        """Find text coordinates using EasyOCR first, then fall back to Tesseract."""
+        """Find text coordinates using EasyOCR first, then fall back to Tesseract.
+
+        When ``region`` is omitted and ``text`` is one of the ``UI_TEXTS``
+        entries, the search is restricted to its ``TEXT_REGIONS`` area. With
+        ``use_easyocr=False`` only the (faster) Tesseract pass runs.
+        ``fast=True`` runs a single Tesseract pass on a downscaled grayscale
+        capture; use it with a low ``confidence`` as a cheap presence check
+        and confirm hits with a normal call.
+        """
 
         variants = [text] if isinstance(text, str) else list(text)
-        targets = [self._normalize(v) if normalize else v.casefold() for v in variants]
-
-        for use_easyocr, name in ((True, "easyocr"), (False, "tesseract")):
+        if region is None:
+            region = default_text_region(variants)
+        # Case variants collapse to one folded target, scored once
+        norm = self._normalize if normalize else str.casefold
+        targets = list(dict.fromkeys(norm(v) for v in variants))
+        engines = ((True, "easyocr"), (False, "tesseract"))
+
+        for use_reader, name in engines if use_easyocr and not fast else engines[1:]:
             try:
                 bbox = self._find_text_engine(
                     targets,
@@ -540,8 +1355,9 @@ class OCREngine:
                     confidence,
                     normalize,
                     region_pad,
-                    use_easyocr,
+                    use_reader,
                     texts_out,
+                    fast,
                 )
             except ScreenshotError:
                 logger.error("Screenshot failed during %s engine", name)
@@ -553,6 +1369,164 @@ class OCREngine:
                 return bbox
         return None
 
+    def find_texts_on_screen(
+        self,
+        texts: Iterable[str] | str,
+        region=None,
+        confidence: float = OCR_CONFIDENCE,
+        normalize: bool = True,
+        region_pad: int = 0,
+    ) -> dict[str, Optional[Tuple[int, int, int, int]]]:
+        """Locate several texts with a single OCR pass per engine.
+
+        EasyOCR runs first; Tesseract only runs if some texts are still
+        missing. Every text is matched against the same set of OCR lines.
+
+        Returns
+        -------
+        dict[str, Tuple[int, int, int, int] | None]
+            Bounding box for each requested text, ``None`` if not found.
+        """
+
+        texts = [texts] if isinstance(texts, str) else list(texts)
+        if region is None:
+            region = default_text_region(texts)
+        targets = {t: self._normalize(t) if normalize else t.casefold() for t in texts}
+        results: dict[str, Optional[Tuple[int, int, int, int]]] = dict.fromkeys(texts)
+
+        for use_easyocr, name in ((True, "easyocr"), (False, "tesseract")):
+            pending = [t for t in texts if results[t] is None]
+            if not pending:
+                break
+            try:
+                _, lines = self._screen_lines(
+                    region, confidence, normalize, region_pad, use_easyocr
+                )
+            except ScreenshotError:
+                logger.error("Screenshot failed during %s engine", name)
+                raise
+            except Exception as exc:
+                logger.exception("%s engine failed: %s", name, exc)
+                continue
+            for t in pending:
+                results[t] = self._match_lines([targets[t]], lines)
+        return results
+
+    def find_texts_in_regions(
+        self,
+        searches: Iterable[Tuple[Iterable[str] | str, Tuple[int, int, int, int]]],
+        confidence: float = OCR_CONFIDENCE,
+        normalize: bool = True,
+        require_all: bool = True,
+        fast: bool = False,
+    ) -> list[Optional[Tuple[int, int, int, int]]]:
+        """Search several screen regions with one capture and one EasyOCR batch.
+
+        Parameters
+        ----------
+        searches:
+            ``(texts, region)`` pairs; ``texts`` is a string or list of
+            variants and ``region`` an ``(x, y, width, height)`` tuple.
+        confidence, normalize:
+            As for :meth:`find_text_on_screen`.
+        require_all:
+            Regions without an EasyOCR match are retried with Tesseract. When
+            ``False`` the retries stop as soon as any search has matched.
+        fast:
+            Skip EasyOCR and run the fast Tesseract pass of
+            :meth:`find_text_on_screen` on each region.
+
+        Returns
+        -------
+        list[Tuple[int, int, int, int] | None]
+            Bounding box per search, in order, ``None`` where nothing matched.
+        """
+        searches = [
+            ([texts] if isinstance(texts, str) else list(texts), region)
+            for texts, region in searches
+        ]
+        norm = self._normalize if normalize else str.casefold
+        targets = [list(dict.fromkeys(map(norm, variants))) for variants, _ in searches]
+        results: list[Optional[Tuple[int, int, int, int]]] = [None] * len(searches)
+
+        reader = None if fast else self.easyocr_reader
+        if reader is not None and searches:
+            try:
+                frame, _, _ = self._capture()
+            except Exception as exc:
+                logger.error("Screenshot failed: %s", exc)
+                raise ScreenshotError("Unable to capture screenshot") from exc
+            done = []
+            batch = []
+            for i, (_, (x, y, w, h)) in enumerate(searches):
+                roi = frame[y : y + h, x : x + w]
+                if not roi.size:
+                    continue
+                self._remember((x, y, w, h), roi)
+                region_used = (x, y, roi.shape[1], roi.shape[0])
+                # Same key as an EasyOCR _screenshot of this region, so
+                # unchanged regions skip preprocessing and the batch
+                key = (self._frame_digest(roi), roi.shape, True, self.preprocess, False)
+                cached = self._cache_get(key)
+                if cached is not None:
+                    done.append((i, cached[0], region_used, cached[1]))
+                else:
+                    batch.append((i, roi, self._ocr_image(roi), region_used, key))
+            if batch:
+                # readtext_batched needs equally sized images; pad rather than
+                # resize so OCR boxes stay in each image's own coordinates
+                bh = max(img.shape[0] for _, _, img, _, _ in batch)
+                bw = max(img.shape[1] for _, _, img, _, _ in batch)
+                padded = [
+                    cv2.copyMakeBorder(
+                        img,
+                        0,
+                        bh - img.shape[0],
+                        0,
+                        bw - img.shape[1],
+                        cv2.BORDER_REPLICATE,
+                    )
+                    for _, _, img, _, _ in batch
+                ]
+                try:
+                    batched = reader.readtext_batched(padded)
+                except Exception as exc:
+                    logger.exception("easyocr engine failed: %s", exc)
+                    batched = []
+                for (i, roi, img, region_used, key), ocr in zip(batch, batched):
+                    ocr_text, df = self._easyocr_frame(ocr)
+                    df = self._cache_put(key, roi, img, df, ocr_text)
+                    done.append((i, img, region_used, df))
+            for i, img, region_used, df in done:
+                if df.empty:
+                    continue
+                img_size = (img.shape[1], img.shape[0])
+                lines = self._df_lines(df, img_size, region_used, confidence, normalize)
+                results[i] = self._match_lines(targets[i], lines)
+
+        for i, (variants, region) in enumerate(searches):
+            if not require_all and any(results):
+                break
+            if results[i] is not None:
+                continue
+            try:
+                results[i] = self._find_text_engine(
+                    targets[i],
+                    variants,
+                    region,
+                    confidence,
+                    normalize,
+                    0,
+                    False,
+                    fast=fast,
+                )
+            except ScreenshotError:
+                logger.error("Screenshot failed during tesseract engine")
+                raise
+            except Exception as exc:
+                logger.exception("tesseract engine failed: %s", exc)
+        return results
+
     def click_text(
         self,
         text: Iterable[str] | str,
@@ -560,23 +1534,40 @@ class OCREngine:
         offset_y: int = 0,
         region=None,
         region_pad: int = 0,
+        expect: Iterable[str] | str | None = None,
+        expect_region=None,
     ) -> bool:
-        """Click on found text or any of its variants."""
+        """Click on found text or any of its variants.
+
+        All variants are matched against one OCR pass; the first variant in
+        order that is found gets clicked. When ``expect`` is given the call
+        waits (up to ``MODAL_WAIT_TIMEOUT``) for that follow-up text to show
+        in ``expect_region`` and returns ``False`` if it never does.
+        """
         variants = [text] if isinstance(text, str) else list(text)
-        for variant in variants:
-            coords = self.find_text_on_screen(
-                variant, region=region, region_pad=region_pad
-            )
-            if coords:
-                x, y, w, h = coords
-                pyautogui.click(x + w // 2 + offset_x, y + h // 2 + offset_y)
-                time.sleep(0.1)
-                return True
+        found = self.find_texts_on_screen(
+            variants, region=region, region_pad=region_pad
+        )
+        coords = next((found[v] for v in variants if found[v]), None)
+        if coords:
+            x, y, w, h = coords
+            pyautogui.click(x + w // 2 + offset_x, y + h // 2 + offset_y)
+            return self._after_click(expect, expect_region)
         logger.error("Text '%s' not found on screen", text)
         if self.debug:
             logger.debug("Saved debug screenshot for '%s'", text)
         return False
 
+    def _after_click(self, expect, expect_region) -> bool:
+        """Let the UI react to a click, waiting for ``expect`` when given."""
+        self.clear_cache()
+        if expect is None:
+            time.sleep(0.1)
+            return True
+        return self.wait_for_text(
+            expect, timeout=MODAL_WAIT_TIMEOUT, region=expect_region
+        )
+
     def wait_for_text(
         self,
         text: Iterable[str] | str,
@@ -585,70 +1576,149 @@ class OCREngine:
         region_pad: int = 0,
         confidence: float = OCR_CONFIDENCE,
     ) -> bool:
-        """Wait until text appears on screen."""
-        end_time = time.time() + timeout
-        while time.time() < end_time:
+        """Wait until text appears on screen.
+
+        Each poll grabs the region and only runs OCR when it differs from the
+        frame OCR'd last (mean absolute difference above
+        ``WAIT_CHANGE_THRESHOLD``). Unchanged polls back off geometrically
+        from ``WAIT_POLL_INITIAL`` up to ``WAIT_POLL_MAX`` seconds. The first
+        ``WAIT_EASYOCR_AFTER`` seconds use Tesseract only; after that every
+        OCR pass also tries EasyOCR.
+        """
+        variants = [text] if isinstance(text, str) else list(text)
+        if region is None:
+            region = default_text_region(variants)
+        start_ns = time.monotonic_ns()
+        end_ns = start_ns + int(timeout * 1e9)
+        escalate_ns = start_ns + int(WAIT_EASYOCR_AFTER * 1e9)
+        delay = WAIT_POLL_INITIAL
+        last = None
+        escalated = False
+        while time.monotonic_ns() < end_ns:
             try:
-                if self.find_text_on_screen(
-                    text, region=region, region_pad=region_pad, confidence=confidence
-                ):
-                    return True
-            except ScreenshotError as exc:
+                frame = self._watch_frame(region, region_pad)
+            except Exception as exc:
                 logger.error(
                     "Screenshot failed while waiting for text '%s': %s", text, exc
                 )
-                raise
-            time.sleep(0.5)
+                raise ScreenshotError("Unable to capture screenshot") from exc
+            escalate = not escalated and time.monotonic_ns() >= escalate_ns
+            changed = (
+                last is None
+                or last.shape != frame.shape
+                or cv2.absdiff(frame, last).mean() > WAIT_CHANGE_THRESHOLD
+            )
+            if changed or escalate:
+                last = frame
+                escalated = escalated or escalate
+                delay = WAIT_POLL_INITIAL
+                try:
+                    if self.find_text_on_screen(
+                        variants,
+                        region=region,
+                        region_pad=region_pad,
+                        confidence=confidence,
+                        use_easyocr=escalated,
+                    ):
+                        return True
+                except ScreenshotError as exc:
+                    logger.error(
+                        "Screenshot failed while waiting for text '%s': %s", text, exc
+                    )
+                    raise
+            else:
+                delay = min(delay * WAIT_POLL_GROWTH, WAIT_POLL_MAX)
+            time.sleep(max(0.0, min(delay, (end_ns - time.monotonic_ns()) / 1e9)))
         logger.error("Timeout waiting for text: %s", text)
         return False
 
+    @staticmethod
+    def _watch_frame(region, region_pad: int) -> np.ndarray:
+        """Grab the pixels of a waited-on region for change detection."""
+        if not region:
+            return grab()
+        x, y, w, h = region
+        x, y = max(0, x - region_pad), max(0, y - region_pad)
+        w, h = w + region_pad * 2, h + region_pad * 2
+        screen_w, screen_h = screen_size()
+        return grab((x, y, min(w, screen_w - x), min(h, screen_h - y)))
+
+    @staticmethod
+    def _draw_boxes(
+        img: np.ndarray,
+        left: np.ndarray,
+        top: np.ndarray,
+        width: np.ndarray,
+        height: np.ndarray,
+    ) -> np.ndarray:
+        """Return a BGR copy of ``img`` with a red outline around every box."""
+        if img.ndim == 2:
+            out = cv2.cvtColor(img, cv2.COLOR_GRAY2BGR)
+        elif img.shape[2] == 4:
+            out = cv2.cvtColor(img, cv2.COLOR_RGBA2BGR)
+        else:
+            out = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+        for x, y, w, h in zip(left.tolist(), top.tolist(), width.tolist(), height.tolist()):
+            cv2.rectangle(out, (x, y), (x + w, y + h), (0, 0, 255), 1)
+        return out
+
+    def _pair_from_df(
+        self,
+        df: pd.DataFrame,
+        debug_dir: Path,
+        annotated_src,
+        left_word: str,
+        right_word: str,
+    ) -> Optional[Tuple[int, int, int, int]]:
+        """Find ``left_word`` followed by ``right_word`` in a word table.
+
+        ``df`` holds ``left``/``top``/``width``/``height``/``text``/``conf``
+        columns in the coordinates of ``annotated_src`` (an RGB image or
+        array). The words are boxed on a copy of it and listed in
+        ``debug_dir``. Returns the pair's bounding box in image coordinates.
+        """
+        debug_dir.mkdir(exist_ok=True)
+        left, top = df["left"].to_numpy(), df["top"].to_numpy()
+        width, height = df["width"].to_numpy(), df["height"].to_numpy()
+        with open(debug_dir / "log.txt", "w", encoding="utf-8") as log:
+            log.writelines(
+                f"{t}\t{c}\t{x},{y},{w},{h}\n"
+                for t, c, x, y, w, h in zip(
+                    df["text"], df["conf"], left, top, width, height
+                )
+            )
+        img = np.asarray(annotated_src)
+        cv2.imwrite(
+            str(debug_dir / "annotated.png"),
+            self._draw_boxes(img, left, top, width, height),
+        )
+        if df.empty:
+            return None
+        df = df.assign(ntext=df["text"].astype(str).map(normalize_tr))
+        df = _assign_line_numbers(df)
+        # Any right word further along the same line counts
+        pair = _pair_rows(
+            df, _word_targets(left_word), _word_targets(right_word), img.shape[1] + 1
+        )
+        if pair is None:
+            return None
+        L, R = pair
+        x = min(L.left, R.left)
+        y = min(L.top, R.top)
+        w = max(L.left + L.width, R.left + R.width) - x
+        h = max(L.top + L.height, R.top + R.height) - y
+        return int(x), int(y), int(w), int(h)
+
     def find_word_pair_tesseract(
         self, img, left_word: str, right_word: str, debug_dir: Path
     ):
-        df = pytesseract.image_to_data(
-            img, lang=self.tesseract_lang, output_type=pytesseract.Output.DATAFRAME
-        ).dropna(subset=["text"])
-        debug_dir.mkdir(exist_ok=True)
-        annotated = img.copy()
-        draw = ImageDraw.Draw(annotated)
-        log_path = debug_dir / "log.txt"
-        with open(log_path, "w", encoding="utf-8") as log:
-            for row in df.itertuples(index=False):
-                draw.rectangle(
-                    xywh_to_ltrb((row.left, row.top, row.width, row.height)),
-                    outline="red",
-                    width=1,
-                )
-                log.write(
-                    f"{row.text}\t{row.conf}\t{row.left},{row.top},{row.width},{row.height}\n"
-                )
-        annotated.save(debug_dir / "annotated.png")
-        df["ntext"] = df["text"].map(self._normalize)
-        df.sort_values("top", inplace=True)
-        line_num = 0
-        last_top = -9999
-        for idx, row in df.iterrows():
-            if row.top - last_top > 10:
-                line_num += 1
-                last_top = row.top
-            df.at[idx, "line_num"] = line_num
-        left_variants = ["Finans", "finans", "FINANS"]
-        right_variants = ["İzle", "izle", "IZLE", "Izle"]
-        left_targets = {self._normalize(w) for w in left_variants}
-        right_targets = {self._normalize(w) for w in right_variants}
-
-        left_tokens = df[df.ntext.isin(left_targets)].sort_values(["line_num", "left"])
-        for _, L in left_tokens.iterrows():
-            line_tokens = df[(df.line_num == L.line_num) & (df.left > L.left)]
-            right_candidates = line_tokens[line_tokens.ntext.isin(right_targets)]
-            if not right_candidates.empty:
-                R = right_candidates.iloc[0]
-                x = min(L.left, R.left)
-                y = min(L.top, R.top)
-                w = max(L.left + L.width, R.left + R.width) - x
-                h = max(L.top + L.height, R.top + R.height) - y
-                return int(x), int(y), int(w), int(h)
-        return None
+        """Find the word pair in ``img`` with Tesseract.
+
+        Uses the engine's resident "tur+eng" model with the
+        ``OCR_TESSERACT_VARIABLES`` whitelist, in sparse-text segmentation.
+        """
+        _, df = self._tesseract_ocr(img, sparse=True)
+        return self._pair_from_df(df, debug_dir, img, left_word, right_word)
 
     def find_word_pair_easyocr(
         self, img, left_word: str, right_word: str, debug_dir: Path
@@ -664,60 +1734,5 @@ class OCREngine:
             logger.error(f"EasyOCR failed: {e}")
             results = []
         logger.info(f"EasyOCR found {len(results)} items")
-        data = []
-        debug_dir.mkdir(exist_ok=True)
-        annotated = img.copy()
-        draw = ImageDraw.Draw(annotated)
-        log_path = debug_dir / "log.txt"
-        with open(log_path, "w", encoding="utf-8") as log:
-            for bbox, text, conf in results:
-                x_coords = [pt[0] for pt in bbox]
-                y_coords = [pt[1] for pt in bbox]
-                left = int(min(x_coords))
-                top = int(min(y_coords))
-                width = int(max(x_coords) - left)
-                height = int(max(y_coords) - top)
-                draw.rectangle(
-                    xywh_to_ltrb((left, top, width, height)), outline="red", width=1
-                )
-                log.write(f"{text}\t{conf}\t{left},{top},{width},{height}\n")
-                data.append(
-                    {
-                        "left": left,
-                        "top": top,
-                        "width": width,
-                        "height": height,
-                        "text": text,
-                        "conf": conf * 100,
-                    }
-                )
-        annotated.save(debug_dir / "annotated.png")
-        df = pd.DataFrame(data)
-        if df.empty:
-            return None
-        df["ntext"] = df["text"].map(self._normalize)
-        df.sort_values("top", inplace=True)
-        line_num = 0
-        last_top = -9999
-        for idx, row in df.iterrows():
-            if row.top - last_top > 10:
-                line_num += 1
-                last_top = row.top
-            df.at[idx, "line_num"] = line_num
-        left_variants = ["Finans", "finans", "FINANS"]
-        right_variants = ["İzle", "izle", "IZLE", "Izle"]
-        left_targets = {self._normalize(w) for w in left_variants}
-        right_targets = {self._normalize(w) for w in right_variants}
-
-        left_tokens = df[df.ntext.isin(left_targets)].sort_values(["line_num", "left"])
-        for _, L in left_tokens.iterrows():
-            line_tokens = df[(df.line_num == L.line_num) & (df.left > L.left)]
-            right_candidates = line_tokens[line_tokens.ntext.isin(right_targets)]
-            if not right_candidates.empty:
-                R = right_candidates.iloc[0]
-                x = min(L.left, R.left)
-                y = min(L.top, R.top)
-                w = max(L.left + L.width, R.left + R.width) - x
-                h = max(L.top + L.height, R.top + R.height) - y
-                return int(x), int(y), int(w), int(h)
-        return None
+        _, df = self._easyocr_frame(results)
+        return self._pair_from_df(df, debug_dir, img, left_word, right_word)
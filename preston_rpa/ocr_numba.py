@@ -0,0 +1,72 @@
+"""Numba kernels for searching OCR word tables.
+
+Numba is an optional dependency; without it the kernels run as plain
+Python over the same NumPy arrays.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; the kernels then run uncompiled
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _find_pair(line_num, left, order, is_right, max_gap):
+    n = line_num.shape[0]
+    for k in range(order.shape[0]):
+        li = order[k]
+        line = line_num[li]
+        x = left[li]
+        for ri in range(n):
+            if not is_right[ri] or line_num[ri] != line:
+                continue
+            dx = left[ri] - x
+            if 0 < dx < max_gap:
+                return li, ri
+    return -1, -1
+
+
+def find_pair(
+    line_num: np.ndarray,
+    left: np.ndarray,
+    is_left: np.ndarray,
+    is_right: np.ndarray,
+    max_gap: int,
+) -> Tuple[int, int]:
+    """Return row indices of the first left/right word pair on one line.
+
+    Left candidates are tried in ``(line_num, left)`` order; for each, the
+    first right word (in row order) on the same line that starts less than
+    ``max_gap`` pixels to its right wins.
+
+    Parameters
+    ----------
+    line_num, left:
+        ``int64`` word columns of the OCR table.
+    is_left, is_right:
+        Boolean masks of the words matching each target.
+    max_gap:
+        Exclusive upper bound on the horizontal offset between the words.
+
+    Returns
+    -------
+    Tuple[int, int]
+        ``(left_row, right_row)``, or ``(-1, -1)`` when no pair exists.
+    """
+    cand = np.flatnonzero(is_left)
+    order = cand[np.lexsort((left[cand], line_num[cand]))]
+    li, ri = _find_pair(line_num, left, order, is_right, max_gap)
+    return int(li), int(ri)
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import re
 import time
-from typing import List, Dict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
 import subprocess
 import shutil
 from pathlib import Path
 
-import ctypes
+import numpy as np
 import pyautogui
 import pygetwindow as gw
 
@@ -20,73 +24,291 @@ from .config import (
     CARI_CODES,
     OCR_CONFIDENCE,
     MODAL_WAIT_TIMEOUT,
+    WAIT_POLL_INITIAL,
+    WAIT_POLL_MAX,
 )
 from .logger import get_logger
 from .ocr_engine import OCREngine
 from .image_matcher import ImageMatcher
-from .utils import xywh_to_ltrb
+from .screen_capture import grab, to_image
 
 logger = get_logger(__name__)
 
+# Compiled once; uiautomation passes compiled patterns through re.compile as is
+_CHROME_RE = re.compile(r".*Chrome")
+_PRESTON_TAB_RE = re.compile(r"(Preston\s+X[iI]\b.*Kurumsal.*|Preston\.html)")
+
+_auto = None
+
+
+def _get_auto():
+    """Import ``uiautomation`` on first use; it loads COM and is Windows-only."""
+    global _auto
+    if _auto is None:
+        import uiautomation
+
+        _auto = uiautomation
+    return _auto
+
+
+def _poll_until(
+    predicate: Callable[[], Any],
+    timeout: float,
+    initial: float = WAIT_POLL_INITIAL,
+    max_interval: float = WAIT_POLL_MAX,
+) -> Any:
+    """Call ``predicate`` until it returns something truthy or time runs out.
+
+    The delay between calls doubles up to ``max_interval`` and drops back
+    to ``initial`` whenever the returned value changes, so a predicate
+    can report progress by returning a different falsy value. Returns
+    the last result of ``predicate``.
+    """
+    deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
+    delay = initial
+    result = last = predicate()
+    while not result:
+        remaining_ns = deadline_ns - time.monotonic_ns()
+        if remaining_ns <= 0:
+            break
+        time.sleep(min(delay, remaining_ns / 1e9))
+        result = predicate()
+        if result is last or result == last:
+            delay = min(delay * 2, max_interval)
+        else:
+            delay = initial
+        last = result
+    return result
+
+
+@lru_cache(maxsize=1)
+def _find_chrome() -> Optional[str]:
+    """Return the path of the first Chrome/Chromium executable found, if any.
+
+    Looked up on first use and then cached; PATH and the install location
+    do not change while the process runs.
+    """
+    for name in ("chrome", "google-chrome", "chromium"):
+        path = shutil.which(name)
+        if path:
+            return path
+    install_paths = (
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+    )
+    return next((p for p in install_paths if Path(p).exists()), None)
+
+
+# Window found by the last focus_preston_window call, checked before
+# enumerating every top-level window again
+_preston_window = None
+
+
+def _find_preston_window(target_title: str):
+    """Return a window titled ``target_title``, preferring the cached one."""
+    global _preston_window
+    window = _preston_window
+    if window is not None:
+        try:
+            # The title of a closed window reads as empty
+            if target_title in window.title:
+                return window
+        except Exception:
+            pass
+    windows = gw.getWindowsWithTitle(target_title)
+    _preston_window = windows[0] if windows else None
+    return _preston_window
+
+
+def _select_preston_tab() -> bool:
+    """Select the Preston tab in an open Chrome window through UIA.
+
+    Returns ``False`` when Chrome or the tab is not found, or when
+    ``uiautomation`` is unavailable.
+    """
+    try:
+        chrome = _get_auto().WindowControl(searchDepth=1, NameRe=_CHROME_RE)
+        if not chrome.Exists(0.3):
+            return False
+        tab = chrome.TabItemControl(NameRe=_PRESTON_TAB_RE)
+        if not tab.Exists(0.2):
+            return False
+        tab.Select()
+        return True
+    except Exception as exc:
+        logger.debug("UIA tab selection failed: %s", exc)
+        return False
+
 
 def focus_preston_window(simulator_path: str) -> None:
     """Bring Preston simulator tab to the foreground or open it if missing."""
     target_title = "Preston Xi Kurumsal Kay"
 
-    # Try to locate a window where the desired tab is already active
-    preston_windows = gw.getWindowsWithTitle(target_title)
-    if preston_windows:
-        preston_window = preston_windows[0]
+    # Try to locate a window where the desired tab is already active; a
+    # Chrome window only carries the title of its active tab, so a Preston
+    # tab in the background is selected directly before giving up
+    preston_window = _find_preston_window(target_title)
+    if not preston_window and _select_preston_tab():
+        preston_window = _poll_until(
+            lambda: _find_preston_window(target_title), timeout=1, initial=0.05
+        )
+    if preston_window:
         preston_window.activate()
         preston_window.maximize()
         time.sleep(1)
         return
 
     # Open the simulator if the tab could not be found
-    chrome_paths = [
-        shutil.which("chrome"),
-        shutil.which("google-chrome"),
-        shutil.which("chromium"),
-        r"C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
-        r"C:\\Program Files (x86)\\Google\\Chrome\\Application\\chrome.exe",
-    ]
-
-    chrome_executable = next((p for p in chrome_paths if p and Path(p).exists()), None)
+    chrome_executable = _find_chrome()
     if not chrome_executable:
+        # Look again next time in case Chrome gets installed meanwhile
+        _find_chrome.cache_clear()
         raise FileNotFoundError("Chrome executable not found. Please install Google Chrome or add it to PATH.")
 
-    subprocess.run(
+    # Chrome hands the URL to a running instance or keeps running itself;
+    # either way only the window matters, so do not wait for the process
+    subprocess.Popen(
         [
             chrome_executable,
             "--new-window",
             "--start-maximized",
             f"file:///{simulator_path}",
-        ]
+        ],
+        creationflags=getattr(subprocess, "DETACHED_PROCESS", 0),
     )
-    time.sleep(2)
-    preston_windows = gw.getWindowsWithTitle(target_title)
-    if preston_windows:
-        preston_window = preston_windows[0]
+    preston_window = _poll_until(
+        lambda: _find_preston_window(target_title), timeout=10, initial=0.1
+    )
+    if preston_window:
         preston_window.activate()
         preston_window.maximize()
     time.sleep(1)
 
 
+def _enable_dpi_awareness() -> None:
+    """Make Win32 and PyAutoGUI report physical pixels (Windows 8.1+)."""
+    import ctypes
+
+    try:
+        ctypes.windll.shcore.SetProcessDpiAwareness(2)  # per-monitor aware
+    except (AttributeError, OSError):
+        pass
+
+
+@dataclass(frozen=True)
+class WindowGeometry:
+    """Screen regions derived from the Preston window's placement."""
+
+    bounds: Tuple[int, int, int, int]  # window (left, top, width, height)
+    window_rect: Tuple[int, int, int, int]
+    menu_region: Tuple[int, int, int, int]
+    dropdown_region: Tuple[int, int, int, int]
+    scale_x: float
+    scale_y: float
+
+
+def _compute_geometry(window) -> WindowGeometry:
+    """Compute the workflow regions for ``window``, clipped to the screen."""
+    import ctypes
+
+    screen_w, screen_h = pyautogui.size()
+    try:
+        user32 = ctypes.windll.user32
+        os_w = user32.GetSystemMetrics(0)
+        os_h = user32.GetSystemMetrics(1)
+        scale_x = screen_w / os_w if os_w else 1
+        scale_y = screen_h / os_h if os_h else 1
+    except Exception:
+        scale_x = scale_y = 1
+
+    window_rect = (
+        int(window.left * scale_x),
+        int(window.top * scale_y),
+        int(window.width * scale_x),
+        int(window.height * scale_y),
+    )
+    if (
+        window_rect[0] < 0
+        or window_rect[1] < 0
+        or window_rect[0] + window_rect[2] > screen_w
+        or window_rect[1] + window_rect[3] > screen_h
+    ):
+        logger.warning("Window rect out of bounds; clipping to screen bounds")
+        left = max(0, window_rect[0])
+        top = max(0, window_rect[1])
+        right = min(window_rect[0] + window_rect[2], screen_w)
+        bottom = min(window_rect[1] + window_rect[3], screen_h)
+        window_rect = (left, top, right - left, bottom - top)
+    offset_x = int(window.width * 0.15 * scale_x)
+    offset_y = int(window.height * 0.1 * scale_y)
+    # Precise menu region covering the "Finans - İzle" menu
+    menu_region = (
+        window_rect[0] + offset_x,
+        window_rect[1] + offset_y,
+        int(500 * scale_x),
+        int(200 * scale_y),
+    )
+    dropdown_region = (
+        menu_region[0],
+        menu_region[1] + menu_region[3] + 5,  # 5px padding
+        int(500 * scale_x),
+        int(300 * scale_y),
+    )
+    return WindowGeometry(
+        bounds=(window.left, window.top, window.width, window.height),
+        window_rect=window_rect,
+        menu_region=menu_region,
+        dropdown_region=dropdown_region,
+        scale_x=scale_x,
+        scale_y=scale_y,
+    )
+
+
 class PrestonRPA:
-    def __init__(self):
-        self.ocr = OCREngine(debug=True)
-        self.image_matcher = ImageMatcher()
+    def __init__(
+        self,
+        ocr: Optional[OCREngine] = None,
+        image_matcher: Optional[ImageMatcher] = None,
+    ):
+        # Engines may be passed in pre-warmed (see OCREngine.warm_up)
+        self.ocr = ocr if ocr is not None else OCREngine(debug=True)
+        self.image_matcher = image_matcher if image_matcher is not None else ImageMatcher()
         self.running = True
+        # Regions for the current Preston window placement; recomputed only
+        # when the window moves or resizes
+        self._geometry: Optional[WindowGeometry] = None
+        # Debug PNGs are encoded and written off the workflow thread
+        self._debug_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="rpa-debug"
+        )
+        self._debug_futures: List[Future] = []
+        # Chrome window control found by _chrome_window
+        self._chrome = None
+        # UIA elements located by _ui_element, keyed by their name
+        self._ui_cache: Dict[str, Any] = {}
+        _enable_dpi_awareness()
+
+    def _save_region(
+        self,
+        region: Tuple[int, int, int, int],
+        path: str,
+        frame: Optional[np.ndarray] = None,
+    ) -> None:
+        """Write ``frame`` (or a grab of ``region`` now) to ``path`` in the background."""
+        img = to_image(frame if frame is not None else grab(region))
+        self._debug_futures.append(self._debug_pool.submit(img.save, path))
+
+    def _flush_debug(self) -> None:
+        """Wait for pending debug image writes and log any that failed."""
+        futures, self._debug_futures = self._debug_futures, []
+        for future in wait(futures).done:
+            exc = future.exception()
+            if exc is not None:
+                logger.warning("Debug image save failed: %s", exc)
 
     def _log_ocr_tokens(self, msg: str, confidence: float) -> None:
-        """Log OCR confidence and the first 20 tokens from the OCR log."""
-        tokens: list[str]
-        try:
-            log_path = self.ocr.run_dir / "ocr_log.txt"
-            with open(log_path, "r", encoding="utf-8") as f:
-                tokens = f.read().split()[:20]
-        except Exception as exc:
-            tokens = [f"log read error: {exc}"]
+        """Log OCR confidence and the last 20 words the OCR engine recognized."""
+        tokens = list(self.ocr.recent_tokens)
         logger.error("%s (confidence=%.2f, tokens=%s)", msg, confidence, tokens)
 
     def start_automation(self, excel_data: List[Dict[str, object]], simulator_path: str):
@@ -96,36 +318,36 @@ class PrestonRPA:
         if not self._wait_for_preston_ready():
             logger.error("Preston not ready")
             return
+        window = gw.getActiveWindow()
+        if window:
+            self._geometry = _compute_geometry(window)
         for entry in excel_data:
             if not self.running:
                 break
             self.execute_workflow(entry)
+        self._flush_debug()
         logger.info("Automation finished")
 
     def stop(self):
         self.running = False
+        self.ocr.clear_cache()
+        self._flush_debug()
 
     def _wait_for_preston_ready(self, timeout: float = 15) -> bool:
         """Preston sekmesi görünür/aktif ve içerik çizilmiş olmadan True dönmez."""
-        import uiautomation as auto
-        from PIL import ImageGrab
-
         CENTER = ["Preston Banka Hesap İzleme", "Banka Hesap İzleme"]
 
-        end_time = time.time() + timeout
-        ok_streak = 0
-
-        def _chrome():
-            return auto.WindowControl(searchDepth=1, NameRe=r".*Chrome")
+        ok_streak = fast_misses = 0
+        menu_roi = center_roi = prev_rect = None
 
-        while time.time() < end_time:
-            ch = _chrome()
-            if not ch.Exists(0.3):
-                time.sleep(0.3)
-                continue
+        def _ready():
+            nonlocal ok_streak, fast_misses, menu_roi, center_roi, prev_rect
+            ch = self._chrome_window()
+            if ch is None:
+                return None
 
             ch.SetActive()
-            tab = ch.TabItemControl(NameRe=r"(Preston\s+X[iI]\b.*Kurumsal.*|Preston\.html)")
+            tab = ch.TabItemControl(NameRe=_PRESTON_TAB_RE)
             if tab.Exists(0.2):
                 try:
                     tab.Select()
@@ -133,40 +355,132 @@ class PrestonRPA:
                     pass
 
             l, t, r, b = ch.BoundingRectangle
-            menu_left, menu_top = l + 8, t + 170
-            menu_width, menu_height = (r - 8) - menu_left, (t + 220) - menu_top
-            menu_roi = (menu_left, menu_top, menu_width, menu_height)
-            center_left, center_top = l + 200, t + 260
-            center_width, center_height = (r - 200) - center_left, (t + 420) - center_top
-            center_roi = (center_left, center_top, center_width, center_height)
-            window_rect = (l, t, r - l, b - t)
-
-            found_izle = self.ocr.find_text_on_screen(
-                ["İzle", "izle", "IZLE"], region=menu_roi
-            )
-            found = found_izle or self.ocr.find_text_on_screen(
-                CENTER, region=center_roi, normalize=True
-            )
-
-            if found:
+            # The window rarely moves while waiting; the ROIs only change with it
+            if (l, t, r, b) != prev_rect:
+                prev_rect = (l, t, r, b)
+                menu_left, menu_top = l + 8, t + 170
+                menu_width, menu_height = (r - 8) - menu_left, (t + 220) - menu_top
+                menu_roi = (menu_left, menu_top, menu_width, menu_height)
+                center_left, center_top = l + 200, t + 260
+                center_width, center_height = (r - 200) - center_left, (t + 420) - center_top
+                center_roi = (center_left, center_top, center_width, center_height)
+
+            # Chrome exposes the page through UIA; OCR only runs when the
+            # menu text is not reachable that way
+            if self._ui_element(ch, "İzle") is not None:
                 ok_streak += 1
-                if ok_streak >= 2:
-                    return True
-            else:
-                ok_streak = 0
-
-            time.sleep(0.25)
+                return ok_streak >= 2
+
+            searches = [(["İzle"], menu_roi), (CENTER, center_roi)]
+            # Cheap downscaled Tesseract presence check first; a hit is
+            # confirmed with the full pass (one screenshot, one EasyOCR
+            # batch). After two straight misses the full-scale pass runs
+            # anyway, in case the text is too small to read downscaled.
+            if fast_misses < 2:
+                hit = any(
+                    self.ocr.find_texts_in_regions(
+                        searches, confidence=0.4, require_all=False, fast=True
+                    )
+                )
+                fast_misses = 0 if hit else fast_misses + 1
+                if not hit:
+                    ok_streak = 0
+                    return None
+            found = any(self.ocr.find_texts_in_regions(searches, require_all=False))
+            ok_streak = ok_streak + 1 if found else 0
+            if ok_streak >= 2:
+                return True
+            # A first hit is reported as False (not None) so the poll delay
+            # resets and the confirming check follows quickly
+            return False if ok_streak else None
+
+        if _poll_until(_ready, timeout):
+            return True
 
         try:
-            ImageGrab.grab(bbox=xywh_to_ltrb(menu_roi)).save("debug_menu_roi.png")
-            ImageGrab.grab(bbox=xywh_to_ltrb(center_roi)).save(
-                "debug_center_roi.png"
+            # The pixels the last failed poll saw, not a fresh grab
+            self._save_region(
+                menu_roi, "debug_menu_roi.png", self.ocr.last_capture(menu_roi)
+            )
+            self._save_region(
+                center_roi, "debug_center_roi.png", self.ocr.last_capture(center_roi)
             )
         except Exception:
             pass
         self._log_ocr_tokens("Preston ready check failed; ROI screenshots saved.", OCR_CONFIDENCE)
         return False
 
+    def _chrome_window(self):
+        """Return the Chrome window control, reusing it while it still exists."""
+        ch = self._chrome
+        if ch is not None and ch.Exists(0):
+            return ch
+        ch = _get_auto().WindowControl(searchDepth=1, NameRe=_CHROME_RE)
+        if not ch.Exists(0.3):
+            self._chrome = None
+            return None
+        self._chrome = ch
+        return ch
+
+    def _ui_element(self, root, name: str, timeout: float = 0.2):
+        """Return the UIA text element called ``name`` below ``root``, or ``None``.
+
+        Elements are cached by name and reused while they still exist. Text
+        Chrome does not expose to accessibility (e.g. canvas content) is
+        never found here, so callers keep OCR as their fallback.
+        """
+        element = self._ui_cache.get(name)
+        if element is not None:
+            try:
+                if element.Exists(0):
+                    return element
+            except Exception:
+                pass
+            del self._ui_cache[name]
+        try:
+            element = root.DocumentControl().TextControl(Name=name, searchDepth=8)
+            if not element.Exists(timeout):
+                return None
+        except Exception as exc:
+            logger.debug("UIA lookup for %r failed: %s", name, exc)
+            return None
+        self._ui_cache[name] = element
+        return element
+
+    def _click_izle_menu(self, menu_region: Tuple[int, int, int, int]) -> None:
+        """Click the "İzle" menu, through UIA when it was found there before."""
+        element = self._ui_cache.get("İzle")
+        if element is not None:
+            try:
+                if element.Exists(0):
+                    element.Click(simulateMove=False)
+                    logger.info("Successfully clicked İzle menu (UIA)")
+                    return
+            except Exception as exc:
+                logger.debug("UIA click on İzle failed: %s", exc)
+            self._ui_cache.pop("İzle", None)
+
+        texts_out: list[str] = []
+        # The poll's hit is clicked directly rather than OCR'd a second time
+        bbox = _poll_until(
+            lambda: self.ocr.find_text_on_screen(
+                ["İzle"],
+                region=menu_region,
+                confidence=0.6,
+                texts_out=texts_out,
+            ),
+            timeout=5,
+        )
+        if not bbox:
+            logger.debug("OCR texts in menu region: %s", texts_out)
+            self._log_ocr_tokens("'İzle' görünmedi", 0.6)
+            raise AssertionError("'İzle' görünmedi")
+        x, y, w, h = bbox
+        x_click, y_click = x + w // 2, y + h // 2
+        pyautogui.click(x_click, y_click)
+        logger.info("Click at %s", (x_click, y_click))
+        logger.info("Successfully clicked İzle menu")
+
     # The following methods are placeholders demonstrating the sequence.
     def execute_workflow(self, data_entry: Dict[str, object]):
         """Execute simplified Preston workflow for a single date group."""
@@ -176,10 +490,10 @@ class PrestonRPA:
             )
             # Navigation Phase
             window = gw.getActiveWindow()
-            window.activate()
-            time.sleep(0.5)
             if not window:
                 raise AssertionError("Preston window not active")
+            window.activate()
+            _poll_until(lambda: window.isActive, timeout=0.5)
             logger.info(
                 "Window: left=%d, top=%d, width=%d, height=%d",
                 window.left,
@@ -187,127 +501,54 @@ class PrestonRPA:
                 window.width,
                 window.height,
             )
-            screen_w, screen_h = pyautogui.size()
-            try:
-                user32 = ctypes.windll.user32
-                os_w = user32.GetSystemMetrics(0)
-                os_h = user32.GetSystemMetrics(1)
-                scale_x = screen_w / os_w if os_w else 1
-                scale_y = screen_h / os_h if os_h else 1
-            except Exception:
-                scale_x = scale_y = 1
-
-            window_rect = (
-                int(window.left * scale_x),
-                int(window.top * scale_y),
-                int(window.width * scale_x),
-                int(window.height * scale_y),
-            )
-            if (
-                window_rect[0] < 0
-                or window_rect[1] < 0
-                or window_rect[0] + window_rect[2] > screen_w
-                or window_rect[1] + window_rect[3] > screen_h
-            ):
-                logger.warning(
-                    "Window rect out of bounds; clipping to screen bounds"
-                )
-                left = max(0, window_rect[0])
-                top = max(0, window_rect[1])
-                right = min(window_rect[0] + window_rect[2], screen_w)
-                bottom = min(window_rect[1] + window_rect[3], screen_h)
-                window_rect = (left, top, right - left, bottom - top)
+            bounds = (window.left, window.top, window.width, window.height)
+            if self._geometry is None or self._geometry.bounds != bounds:
+                self._geometry = _compute_geometry(window)
+            geometry = self._geometry
+            window_rect = geometry.window_rect
+            scale_x, scale_y = geometry.scale_x, geometry.scale_y
+            menu_region = geometry.menu_region
+            dropdown_region = geometry.dropdown_region
             logger.info("Window rect: %s", window_rect)
-            offset_x = int(window.width * 0.15 * scale_x)
-            offset_y = int(window.height * 0.1 * scale_y)
-            # Precise menu region covering the "Finans - İzle" menu
-            menu_region = (
-                window_rect[0] + offset_x,
-                window_rect[1] + offset_y,
-                int(500 * scale_x),
-                int(200 * scale_y),
-            )
-            dropdown_region = (
-                menu_region[0],
-                menu_region[1] + menu_region[3] + 5,  # 5px padding
-                int(500 * scale_x),
-                int(300 * scale_y),
-            )
-            dropdown_screenshot = pyautogui.screenshot(region=dropdown_region)
-            dropdown_screenshot.save("debug_dropdown_region.png")
             logger.info("Menu region: %s", menu_region)
-            menu_screenshot = pyautogui.screenshot(region=menu_region)
-            menu_screenshot.save("debug_menu_only.png")
-            self.ocr._save_debug_image(menu_screenshot, "debug_menu_region")
-            # Menu search screenshots
-            self.ocr.capture_image(region=menu_region, step_name="menu_search_before")
-            deadline = time.time() + 5
-            ok = 0
-            texts_out: list[str] = []
-            while time.time() < deadline:
-                bbox = self.ocr.find_text_on_screen(
-                    ["İzle", "izle", "Izle"],
-                    region=menu_region,
-                    confidence=0.6,
-                    texts_out=texts_out,
+            if self.ocr.debug:
+                self._save_region(dropdown_region, "debug_dropdown_region.png")
+                self._save_region(menu_region, "debug_menu_only.png")
+                # Menu search screenshots
+                self.ocr.capture_image(region=menu_region, step_name="menu_search_before")
+            self._click_izle_menu(menu_region)
+            if not self.ocr.wait_for_text(
+                UI_TEXTS["banka_hesap_izleme"],
+                timeout=2,
+                region=dropdown_region,
+                confidence=0.6,
+            ):
+                self._log_ocr_tokens(
+                    "wait_for_text failed for 'Banka hesap izleme' in İzle dropdown",
+                    0.6,
                 )
-                if bbox:
-                    ok += 1
-                    if ok >= 1:
-                        break
-                else:
-                    ok = 0
-                time.sleep(0.2)
-            else:
-                logger.debug("OCR texts in menu region: %s", texts_out)
-                self._log_ocr_tokens("'İzle' görünmedi", 0.6)
-                raise AssertionError("'İzle' görünmedi")
-            bbox = self.ocr.find_text_on_screen(
-                ["İzle", "izle", "IZLE"],
-                region=menu_region,
-                confidence=OCR_CONFIDENCE,
-            )
-            if bbox:
-                x, y, w, h = bbox
-                x_click, y_click = x + w // 2, y + h // 2
-                pyautogui.click(x_click, y_click)
-                logger.info("Click at %s", (x_click, y_click))
-                logger.info("Successfully clicked İzle menu")
-                if not self.ocr.wait_for_text(
-                    UI_TEXTS["banka_hesap_izleme"],
-                    timeout=2,
-                    region=dropdown_region,
-                    confidence=0.6,
-                ):
-                    self._log_ocr_tokens(
-                        "wait_for_text failed for 'Banka hesap izleme' in İzle dropdown",
-                        0.6,
-                    )
-                    raise AssertionError(
-                        "'Finans - İzle' dropdown did not open or 'Banka hesap izleme' not found"
-                    )
-                dropdown_list_region = dropdown_region
-                option_bbox = self.ocr.find_text_on_screen(
-                    ["Banka hesap izleme"],
-                    region=dropdown_list_region,
-                    confidence=0.4,
+                raise AssertionError(
+                    "'Finans - İzle' dropdown did not open or 'Banka hesap izleme' not found"
                 )
-                if option_bbox:
-                    dx, dy, dw, dh = option_bbox
-                    pyautogui.click(dx + dw // 2, dy + dh // 2)
-                    logger.info("Clicked 'Banka hesap izleme' option")
-                else:
-                    self._log_ocr_tokens(
-                        "'Banka hesap izleme' option not found in dropdown",
-                        0.4,
-                    )
-                    raise AssertionError("'Banka hesap izleme' option not found")
+            dropdown_list_region = dropdown_region
+            option_bbox = self.ocr.find_text_on_screen(
+                ["Banka hesap izleme"],
+                region=dropdown_list_region,
+                confidence=0.4,
+            )
+            if option_bbox:
+                dx, dy, dw, dh = option_bbox
+                pyautogui.click(dx + dw // 2, dy + dh // 2)
+                logger.info("Clicked 'Banka hesap izleme' option")
             else:
-                self._log_ocr_tokens("'İzle' menu not found", OCR_CONFIDENCE)
-                raise AssertionError("'İzle' menu not found")
-            self.ocr.capture_image(region=dropdown_region, step_name="menu_search_after")
-            self.ocr._screenshot(region=dropdown_region, step_name="menu_after_dropdown")
-            time.sleep(CLICK_DELAY)
+                self._log_ocr_tokens(
+                    "'Banka hesap izleme' option not found in dropdown",
+                    0.4,
+                )
+                raise AssertionError("'Banka hesap izleme' option not found")
+            if self.ocr.debug:
+                self.ocr.capture_image(region=dropdown_region, step_name="menu_search_after")
+                self.ocr._screenshot(region=dropdown_region, step_name="menu_after_dropdown")
 
             # Click BANKA ribbon icon to open Banka İzleme popup
             bank_region = (
@@ -316,18 +557,19 @@ class PrestonRPA:
                 int(100 * scale_x),   # Dar width
                 int(80 * scale_y),    # Ribbon height
             )
-            bank_screenshot = pyautogui.screenshot(region=bank_region)
-            bank_screenshot.save("debug_bank_region.png")
+            if self.ocr.debug:
+                self._save_region(bank_region, "debug_bank_region.png")
             if not self.ocr.wait_for_text(
-                ["BANKA", "Banka"],
-                timeout=3,
+                ["Banka"],
+                # Also covers the UI settling after the dropdown click
+                timeout=CLICK_DELAY + 3,
                 region=bank_region,
                 confidence=0.3,
             ):
                 self._log_ocr_tokens("'Banka' icon not found", 0.3)
                 raise AssertionError("'Banka' icon not found")
             banka_bbox = self.ocr.find_text_on_screen(
-                ["BANKA", "Banka"], region=bank_region, confidence=0.3
+                ["Banka"], region=bank_region, confidence=0.3
             )
             if banka_bbox:
                 bx, by, bw, bh = banka_bbox
@@ -345,7 +587,7 @@ class PrestonRPA:
                 int(400 * scale_y),
             )
             if not self.ocr.wait_for_text(
-                ["Banka İzleme", "Banka izleme"],
+                ["Banka İzleme"],
                 timeout=MODAL_WAIT_TIMEOUT,
                 region=popup_region,
                 confidence=0.5,
@@ -363,7 +605,6 @@ class PrestonRPA:
                 raise AssertionError("Dropdown for 'Banka hesap izleme' not found")
             dx, dy, dw, dh = dropdown_bbox
             pyautogui.click(dx + dw // 2, dy + dh // 2)
-            time.sleep(CLICK_DELAY)
             dropdown_list_region = (
                 dx,
                 dy + dh,
@@ -372,7 +613,7 @@ class PrestonRPA:
             )
             if not self.ocr.wait_for_text(
                 UI_TEXTS["banka_hesap_izleme"],
-                timeout=5,
+                timeout=CLICK_DELAY + 5,
                 region=dropdown_list_region,
                 confidence=0.5,
             ):
@@ -405,7 +646,16 @@ class PrestonRPA:
                 raise AssertionError(
                     "'Tamam' button not found in Banka İzleme popup"
                 )
-            time.sleep(CLICK_DELAY)
+
+            # The sidebar overlaps the popup, so "Hesap No" can be readable
+            # beside it while it closes; wait (up to CLICK_DELAY) until its
+            # Tamam button is gone before looking for the label
+            _poll_until(
+                lambda: not self.ocr.find_text_on_screen(
+                    UI_TEXTS["tamam_button"], region=popup_region, confidence=OCR_CONFIDENCE
+                ),
+                timeout=CLICK_DELAY,
+            )
 
             # Click "..." button next to Hesap No
             sidebar_region = (
@@ -414,8 +664,12 @@ class PrestonRPA:
                 int(350 * scale_x),
                 int(500 * scale_y),
             )
-            hesap_bbox = self.ocr.find_text_on_screen(
-                ["Hesap No", "Hesap no"], region=sidebar_region, confidence=0.5
+            # Polled for up to CLICK_DELAY while the sidebar redraws
+            hesap_bbox = _poll_until(
+                lambda: self.ocr.find_text_on_screen(
+                    ["Hesap No"], region=sidebar_region, confidence=0.5
+                ),
+                timeout=CLICK_DELAY,
             )
             if not hesap_bbox:
                 self._log_ocr_tokens("'Hesap No' label not found", 0.5)
@@ -425,7 +679,6 @@ class PrestonRPA:
             button_y = hy + hh // 2
             pyautogui.click(button_x, button_y)
             logger.info("Clicked account search button")
-            time.sleep(CLICK_DELAY)
 
             # Select specific account from popup
             account_popup_region = (
@@ -469,7 +722,13 @@ class PrestonRPA:
                 raise AssertionError(
                     "'Tamam' button not found in account selection"
                 )
-            time.sleep(CLICK_DELAY)
+            # Give the popup up to CLICK_DELAY to close, but no longer than it takes
+            _poll_until(
+                lambda: not self.ocr.find_text_on_screen(
+                    account_text, region=account_popup_region, confidence=OCR_CONFIDENCE
+                ),
+                timeout=CLICK_DELAY,
+            )
 
             logger.info("Account selection completed for %s", data_entry["tarih"])
         except Exception as exc:
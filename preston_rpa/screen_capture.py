@@ -0,0 +1,58 @@
+"""Screen capture helpers built on python-mss."""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional, Tuple
+
+import mss
+import numpy as np
+from PIL import Image
+
+_local = threading.local()
+
+
+def _sct():
+    """Return the ``mss`` instance bound to the calling thread.
+
+    ``mss`` keeps per-thread device contexts on Windows, so one instance is
+    created lazily for each thread and reused for every subsequent grab.
+    """
+    sct = getattr(_local, "sct", None)
+    if sct is None:
+        sct = _local.sct = mss.mss()
+    return sct
+
+
+def screen_size() -> Tuple[int, int]:
+    """Return the ``(width, height)`` of the primary screen."""
+    monitor = _sct().monitors[1]
+    return monitor["width"], monitor["height"]
+
+
+def grab(region: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
+    """Capture the primary screen or an ``(x, y, width, height)`` region.
+
+    Returns
+    -------
+    np.ndarray
+        ``(height, width, 4)`` ``uint8`` BGRA array viewing the buffer
+        returned by ``mss`` without an intermediate copy.
+    """
+    sct = _sct()
+    if region:
+        x, y, w, h = region
+        monitor = {"left": int(x), "top": int(y), "width": int(w), "height": int(h)}
+    else:
+        monitor = sct.monitors[1]
+    shot = sct.grab(monitor)
+    # ``shot.bgra`` is ``bytes(shot.raw)``, a full copy of the pixels;
+    # viewing the raw bytearray skips it
+    return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+
+def to_image(arr: np.ndarray) -> Image.Image:
+    """Convert a BGRA capture (or a slice of one) to an RGB PIL image."""
+    arr = np.ascontiguousarray(arr)
+    h, w = arr.shape[:2]
+    return Image.frombuffer("RGB", (w, h), arr, "raw", "BGRX", 0, 1)
@@ -3,19 +3,25 @@
 
 import argparse
 import logging
+import os
 import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Any, Optional
 
-from openpyxl import load_workbook
+import pandas as pd
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.common.exceptions import WebDriverException, ScriptTimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 
 
@@ -34,45 +40,133 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+try:  # python-calamine (Rust) parses .xlsx much faster than openpyxl
+    import python_calamine  # noqa: F401
 
-def read_excel(path: Path) -> List[Dict[str, Any]]:
+    # pandas only knows the calamine engine from 2.2 on
+    _HAVE_CALAMINE = tuple(int(p) for p in pd.__version__.split(".")[:2]) >= (2, 2)
+except ImportError:
+    _HAVE_CALAMINE = False
+EXCEL_ENGINE = "calamine" if _HAVE_CALAMINE else "openpyxl"
+
+
+# Excel header (casefolded) -> PosRow field
+COLUMN_MAP = {
+    k.casefold(): v
+    for k, v in {
+        "Tarih": "tarih",
+        "Firma": "firma",
+        "Tutar": "tutar",
+        "Açıklama": "aciklama",
+        "Aciklama": "aciklama",
+        "Döviz": "doviz",
+        "Doviz": "doviz",
+        "Vade Tarihi": "vade_tarihi",
+    }.items()
+}
+
+
+@dataclass(slots=True)
+class PosRow:
+    """One POS entry read from the Excel sheet; ``None`` marks an empty cell."""
+
+    tarih: Any = ""
+    firma: Any = ""
+    aciklama: Any = ""
+    tutar: Any = ""
+    doviz: Optional[str] = None
+    vade_tarihi: Optional[str] = None
+
+
+_POS_ROW_FIELDS = tuple(f.name for f in fields(PosRow))
+_POS_ROW_DEFAULTS = {f.name: f.default for f in fields(PosRow)}
+
+
+def _iso_date(value: Any) -> Any:
+    """Return ``value`` as an ISO date string if it is a datetime."""
+    return value.date().isoformat() if isinstance(value, datetime) else value
+
+
+def read_excel(path: Path) -> List[PosRow]:
     """Read POS data from an Excel file."""
     logger.info("Reading Excel data from %s", path)
-    workbook = load_workbook(path)
-    sheet = workbook.active
-    rows: List[Dict[str, Any]] = []
-
-    column_map = {
-        "tarih": "tarih",
-        "firma": "firma",
-        "tutar": "tutar",
-        "açıklama": "aciklama",
-        "aciklama": "aciklama",
-        "döviz": "doviz",
-        "doviz": "doviz",
-        "vade tarihi": "vade_tarihi",
-    }
-
-    raw_header = [str(cell).strip() if cell else "" for cell in next(sheet.iter_rows(min_row=1, max_row=1, values_only=True))]
-    header = [column_map.get(h.casefold(), h) for h in raw_header]
-
-    for row in sheet.iter_rows(min_row=2, values_only=True):
-        item: Dict[str, Any] = {}
-        for key, value in zip(header, row):
-            if isinstance(value, datetime):
-                item[key] = value.date().isoformat()
-            else:
-                item[key] = value
-        rows.append(item)
+    # Only truly empty cells are missing; text such as "NA" stays text
+    df = pd.read_excel(path, engine=EXCEL_ENGINE, keep_default_na=False, na_values=[""])
+
+    # pandas names blank header cells "Unnamed: <n>"
+    raw_header = ["" if str(h).startswith("Unnamed:") else str(h).strip() for h in df.columns]
+    df.columns = [COLUMN_MAP.get(h.casefold(), h) for h in raw_header]
+
+    # Like the former per-row dicts, the last of several equally named columns wins
+    if df.columns.has_duplicates:
+        df = df.loc[:, ~df.columns.duplicated(keep="last")].copy()
+    # Every datetime column becomes ISO date strings in one vectorized pass
+    for key in df.select_dtypes(include=["datetime", "datetimetz"]).columns:
+        df[key] = df[key].dt.strftime("%Y-%m-%d")
+    # Columns mixing dates with text stay object dtype; convert their
+    # datetime (and Timestamp) cells one by one
+    for key in df.select_dtypes(include="object").columns:
+        df[key] = df[key].map(_iso_date)
+    # A blank cell turns an integer column into float64; give whole numbers
+    # back as ints, as openpyxl returns them, so 1500 is not typed "1500.0"
+    for key in df.select_dtypes(include="float").columns:
+        values = df[key]
+        whole = values.notna() & (values % 1 == 0)
+        if whole.any():
+            df[key] = values.astype(object).mask(
+                whole, values.where(whole, 0).astype("int64")
+            )
+    # Empty cells come back as NaN/NaT; PosRow holds None for them
+    df = df.astype(object).where(df.notna(), None)
+    for field in _POS_ROW_FIELDS:
+        if field not in df.columns:
+            df[field] = _POS_ROW_DEFAULTS[field]
+    rows = [
+        PosRow(*values)
+        for values in df[list(_POS_ROW_FIELDS)].itertuples(index=False, name=None)
+    ]
     logger.info("Loaded %d rows from Excel", len(rows))
     return rows
 
 
-def setup_driver() -> webdriver.Chrome:
-    """Initialise Chrome WebDriver."""
+# chromedriver path resolved by webdriver-manager, reused for up to a week
+DRIVER_PATH_CACHE = Path.home() / ".cache" / "preston_rpa" / "driver_path.txt"
+DRIVER_PATH_MAX_AGE = 7 * 24 * 3600
+
+
+@lru_cache(maxsize=None)
+def _driver_path() -> str:
+    """Return the chromedriver path, asking webdriver-manager at most weekly.
+
+    ``ChromeDriverManager().install()`` checks online for a newer driver on
+    every call, which adds seconds to each start.
+    """
+    try:
+        if time.time() - DRIVER_PATH_CACHE.stat().st_mtime < DRIVER_PATH_MAX_AGE:
+            path = DRIVER_PATH_CACHE.read_text(encoding="utf-8").strip()
+            if path and Path(path).exists():
+                return path
+    except OSError:
+        pass
+    path = ChromeDriverManager().install()
+    try:
+        DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed so parallel workers never read half a path
+        tmp = DRIVER_PATH_CACHE.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(path, encoding="utf-8")
+        os.replace(tmp, DRIVER_PATH_CACHE)
+    except OSError as exc:
+        logger.warning("Could not cache chromedriver path: %s", exc)
+    return path
+
+
+def setup_driver(user_data_dir: Optional[str] = None) -> webdriver.Chrome:
+    """Initialise Chrome WebDriver, optionally with its own profile directory."""
     options = Options()
     options.add_argument("--start-maximized")
-    driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()), options=options)
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+    driver = webdriver.Chrome(service=ChromeService(_driver_path()), options=options)
     return driver
 
 
@@ -82,16 +176,36 @@ def open_application(driver: webdriver.Chrome, html_path: Path) -> None:
     logger.info("Opened Preston simulator at %s", html_path)
 
 
+# Resolves true once the body has no ``loading`` class and #modalOverlay is
+# gone or hidden, or false after arguments[0] milliseconds. A MutationObserver
+# re-checks on every DOM change, so the wait is one WebDriver round trip.
+_WAIT_OVERLAY_CLOSED_JS = """
+var done = arguments[arguments.length - 1];
+function idle() {
+    if (document.body.classList.contains('loading')) return false;
+    var o = document.getElementById('modalOverlay');
+    if (!o) return true;
+    var style = getComputedStyle(o);
+    return style.display === 'none' || style.visibility === 'hidden';
+}
+if (idle()) { done(true); return; }
+var timer;
+var observer = new MutationObserver(function () {
+    if (idle()) { observer.disconnect(); clearTimeout(timer); done(true); }
+});
+observer.observe(document.body, {attributes: true, childList: true, subtree: true});
+timer = setTimeout(function () { observer.disconnect(); done(idle()); }, arguments[0]);
+"""
+
+
 def _ensure_overlay_closed(driver: webdriver.Chrome, timeout: int = 10) -> None:
     """Ensure that loading or modal overlays are not blocking interactions."""
     try:
-        WebDriverWait(driver, timeout).until(
-            lambda d: not d.execute_script("return document.body.classList.contains('loading')")
-        )
-        WebDriverWait(driver, timeout).until(
-            EC.invisibility_of_element_located((By.ID, "modalOverlay"))
-        )
-    except TimeoutException:
+        closed = driver.execute_async_script(_WAIT_OVERLAY_CLOSED_JS, timeout * 1000)
+    except ScriptTimeoutException:
+        # The session's script timeout is shorter than ``timeout``
+        closed = False
+    if not closed:
         driver.execute_script(
             "document.body.classList.remove('loading');"
             "var o=document.getElementById('modalOverlay');"
@@ -118,35 +232,76 @@ def navigate_to_pos(driver: webdriver.Chrome) -> None:
     logger.debug("POS modal opened")
 
 
-def fill_pos_form(driver: webdriver.Chrome, data: Dict[str, Any]) -> None:
-    """Fill POS entry form and save."""
-    driver.find_element(By.ID, "posTarih").clear()
-    driver.find_element(By.ID, "posTarih").send_keys(str(data.get("tarih", "")))
+# Element id of the POS form input for each PosRow field
+FIELD_IDS = {
+    "tarih": "posTarih",
+    "firma": "posKartHesap",
+    "aciklama": "posAciklama",
+    "tutar": "posTutar",
+    "doviz": "posDoviz",
+    "vade_tarihi": "posVadeTarihi",
+}
+# Fields left untouched in the form when the row has no value for them
+OPTIONAL_FIELDS = frozenset({"doviz", "vade_tarihi"})
+
+# Sets every POS field, fires the events the page listens for and clicks save,
+# all in one WebDriver command. arguments[0] maps element ids to values.
+_FILL_POS_FORM_JS = """
+var values = arguments[0];
+for (var id in values) {
+    var el = document.getElementById(id);
+    el.value = values[id];
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+document.querySelector('.modal-buttons .primary').click();
+"""
 
-    driver.find_element(By.ID, "posKartHesap").send_keys(str(data.get("firma", "")))
-    driver.find_element(By.ID, "posAciklama").send_keys(str(data.get("aciklama", "")))
-    driver.find_element(By.ID, "posTutar").send_keys(str(data.get("tutar", "")))
 
-    doviz = data.get("doviz")
-    if doviz:
-        driver.find_element(By.ID, "posDoviz").send_keys(str(doviz))
+def fill_pos_form(
+    driver: webdriver.Chrome, data: PosRow, clear_optional: bool = False
+) -> None:
+    """Fill POS entry form and save.
 
-    vade = data.get("vade_tarihi")
-    if vade:
-        driver.find_element(By.ID, "posVadeTarihi").send_keys(str(vade))
+    Empty optional fields are left untouched unless ``clear_optional`` is
+    set; a form reused from the previous row still holds that row's values.
+    """
+    values = {}
+    for field, element_id in FIELD_IDS.items():
+        value = getattr(data, field)
+        if value or field not in OPTIONAL_FIELDS:
+            values[element_id] = str(value)
+        elif clear_optional:
+            values[element_id] = ""
 
-    driver.find_element(By.CSS_SELECTOR, ".modal-buttons .primary").click()
+    driver.execute_script(_FILL_POS_FORM_JS, values)
     _ensure_overlay_closed(driver)
     logger.info("POS entry saved for %s", data)
 
 
-def process_entries(driver: webdriver.Chrome, entries: List[Dict[str, Any]]) -> None:
+def _pos_modal_open(driver: webdriver.Chrome) -> bool:
+    """Return whether the POS entry modal is currently shown."""
+    return bool(
+        driver.execute_script(
+            "var m=document.getElementById('posModal');"
+            "if(!m){return false;}"
+            "var s=getComputedStyle(m);"
+            "return s.display!=='none'&&s.visibility!=='hidden';"
+        )
+    )
+
+
+def process_entries(driver: webdriver.Chrome, entries: List[PosRow]) -> None:
     for entry in entries:
         for attempt in range(3):
             try:
-                navigate_to_pos(driver)
-                fill_pos_form(driver, entry)
-                _ensure_overlay_closed(driver)
+                # The modal can stay open between saves; the menu and ribbon
+                # are only walked again when it has closed
+                reused = _pos_modal_open(driver)
+                if not reused:
+                    navigate_to_pos(driver)
+                # fill_pos_form already waits for the overlays to clear
+                fill_pos_form(driver, entry, clear_optional=reused)
                 break
             except Exception as exc:  # pylint: disable=broad-except
                 logger.exception(
@@ -157,13 +312,13 @@ def process_entries(driver: webdriver.Chrome, entries: List[Dict[str, Any]]) ->
             logger.error("Failed to process row %s after retries", entry)
 
 
-def main(excel_path: Path) -> None:
-    data_rows = read_excel(excel_path)
-    driver = setup_driver()
+def _run_session(entries: List[PosRow], user_data_dir: Optional[str] = None) -> None:
+    """Enter ``entries`` through one Chrome session."""
+    driver = setup_driver(user_data_dir)
     try:
         html_file = Path(__file__).parent / "RPA_Expert.html"
         open_application(driver, html_file)
-        process_entries(driver, data_rows)
+        process_entries(driver, entries)
     except WebDriverException as exc:
         logger.exception("WebDriver error: %s", exc)
     finally:
@@ -171,8 +326,40 @@ def main(excel_path: Path) -> None:
         logger.info("Driver closed")
 
 
+def _run_worker_session(entries: List[PosRow]) -> None:
+    """Process pool entry point: a session with a private Chrome profile."""
+    # Concurrent Chrome instances cannot share a profile directory
+    with tempfile.TemporaryDirectory(prefix="preston_chrome_") as profile:
+        _run_session(entries, profile)
+
+
+def main(excel_path: Path, workers: int = 1) -> None:
+    data_rows = read_excel(excel_path)
+    workers = max(1, min(workers, len(data_rows)))
+    if workers == 1:
+        _run_session(data_rows)
+        return
+
+    # Rows are independent, so each worker drives its own browser over an
+    # interleaved share of them
+    # Resolved once here so the workers find the path already cached
+    _driver_path()
+    shards = [data_rows[i::workers] for i in range(workers)]
+    logger.info("Processing %d rows in %d Chrome sessions", len(data_rows), workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_worker_session, shard) for shard in shards]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.exception("Worker session failed: %s", exc)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Automate POS entries on Preston simulator")
     parser.add_argument("--excel", default="pos_data.xlsx", help="Path to Excel file with POS data")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of parallel Chrome sessions"
+    )
     args = parser.parse_args()
-    main(Path(args.excel))
+    main(Path(args.excel), args.workers)